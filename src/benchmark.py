@@ -0,0 +1,4 @@
+from scheduling.bench import main
+
+if __name__ == "__main__":
+    main()
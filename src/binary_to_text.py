@@ -0,0 +1,4 @@
+from scheduling.binary import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+from scheduling.compare import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+from scheduling.workload import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+from scheduling.cli import main
+from scheduling.policies import MLFQ
+
+if __name__ == "__main__":
+    main(MLFQ)
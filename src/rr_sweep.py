@@ -0,0 +1,4 @@
+from scheduling.sweep import main
+
+if __name__ == "__main__":
+    main()
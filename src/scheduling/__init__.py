@@ -0,0 +1,12 @@
+# CPU çizelgeleme simülasyonu için ortak paket.
+# Süreç tablosu, ayrık olay çekirdeği ve politikalar burada; src/ altındaki
+# algoritma betikleri bu paketin ince komut satırı sarmalayıcılarıdır.
+
+from .engine import CONTEXT_SWITCH, SimulationResult, Simulator, simulate
+from .heaps import IndexedHeap
+from .loader import load_processes, map_priority
+from .policies import (CFS, FCFS, MLFQ, POLICIES, SJF, SRTF, Policy,
+                       PreemptivePriority, Priority, RoundRobin)
+from .process_table import ProcessTable
+from .report import compute_metrics, format_report, write_report
+from .timeline import IDLE, ROUND, Timeline
@@ -0,0 +1,339 @@
+# Ölçeklenme kıyaslaması (benchmark).
+# Algoritma betikleri artan boyutlu sentetik izler (10^2 - 10^6 satır) üzerinde ayrı süreçler
+# olarak çalıştırılır; her koşu için duvar saati süresi, saniyedeki olay sayısı ve en yüksek
+# bellek kullanımı (peak RSS) ölçülür. Süre ~ n^k modelinin üssü k, log-log uzayında en küçük
+# kareler doğrusuyla tahmin edilir.
+#
+# Betikler komut satırından çağrıldığı için aynı ölçüm, --extra-args (ör. --fast-forward) veya
+# --command şablonuyla başka bir motora da uygulanabilir; sonuçlar JSON olarak saklanır ve
+# --compare ile bir taban çizgisine (baseline) göre gerilemeler işaretlenir.
+#
+# Olay sayısı = 2 x işlem sayısı (varış + tamamlanma) + bağlam değiştirme sayısı (f bölümü);
+# böylece farklı motorlar aynı iş yükünde aynı olay sayısını raporlar.
+
+import argparse
+import json
+import math
+import os
+import platform
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from .workload import generate_rows, write_workload
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(os.path.dirname(SRC_DIR), 'reports', 'benchmark_baseline.json')
+FORMAT_VERSION = 1
+
+# Algoritma adı -> src/ altındaki betik
+SCRIPTS = {
+    'fcfs': 'fcfs',
+    'sjf': 'non_preemptive_sjf',
+    'srtf': 'preemptive_sjf',
+    'rr': 'round_robin',
+    'priority': 'non_preemptive_priority',
+    'preemptive_priority': 'preemptive_priority',
+    'mlfq': 'mlfq',
+    'cfs': 'cfs',
+}
+DEFAULT_ALGORITHMS = ['fcfs', 'sjf', 'srtf', 'rr', 'priority', 'preemptive_priority']
+DEFAULT_COMMAND = "{python} {script} {input}"
+# Yerleşik komut şablonunda her koşuya eklenen argümanlar: sonuç önbelleği kapatılır ki
+# ölçülen süre önbellekten kopyalama değil simülasyon olsun (tekrarlar ve taban çizgisi
+# karşılaştırması dahil); iz önbelleği de kapatılır ki her durum CSV'yi aynı şekilde ayrıştırsın.
+# --command ile verilen motorlar bu bayrakları tanımayabilir; onlara yalnızca --harness-args eklenir.
+HARNESS_ARGS = ['--no-cache', '--no-trace-cache']
+
+# Komut satırında verilmeyen ayarlar (karşılaştırmada önce taban çizgisindekiler kullanılır)
+DEFAULTS = {
+    'sizes': [100, 1000, 10000, 100000, 1000000],
+    'algorithms': DEFAULT_ALGORITHMS,
+    'quanta': [2, 10, 50],
+    'seed': 0,
+    'rate': 0.18,
+    'mean_burst': 5.0,
+}
+
+
+def build_cases(algorithms, quanta):
+    # (durum adı, betik adı, ek argümanlar); Round Robin her quantum için ayrı bir durumdur
+    cases = []
+    for name in algorithms:
+        if name == 'rr':
+            cases.extend((f"rr_q{q}", SCRIPTS[name], ['--quantum', str(q)]) for q in quanta)
+        else:
+            cases.append((name, SCRIPTS[name], []))
+    return cases
+
+
+def make_command(template, script, input_path, args):
+    command = template.format(python=shlex.quote(sys.executable),
+                              script=shlex.quote(os.path.join(SRC_DIR, script + '.py')),
+                              name=script, src=shlex.quote(SRC_DIR), input=shlex.quote(input_path))
+    return shlex.split(command) + args
+
+
+def context_switches(workdir):
+    # Sonuç dosyasının son satırı f) bölümündeki bağlam değiştirme sayısıdır
+    for name in os.listdir(workdir):
+        if name.startswith('sonuc_') and name.endswith('.txt'):
+            with open(os.path.join(workdir, name), 'rb') as f:
+                f.seek(max(0, os.path.getsize(f.name) - 64))
+                last = f.read().decode('utf-8', 'replace').splitlines()[-1].strip()
+            return int(last) if last.isdigit() else None
+    return None
+
+
+def run_once(command, workdir, timeout):
+    """Komutu workdir içinde çalıştırır; (duvar saati, peak RSS MB veya None, durum) döndürür."""
+    with open(os.path.join(workdir, 'stdout.txt'), 'wb') as out:
+        start = time.perf_counter()
+        proc = subprocess.Popen(command, cwd=workdir, stdout=out, stderr=subprocess.STDOUT)
+        timer = threading.Timer(timeout, proc.kill)
+        timer.start()
+        try:
+            if hasattr(os, 'wait4'):
+                # wait4 sadece bu alt sürecin kaynak kullanımını verir
+                _, status, usage = os.wait4(proc.pid, 0)
+                proc.returncode = os.waitstatus_to_exitcode(status)
+                rss = usage.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+            else:
+                proc.wait()
+                rss = None
+            wall = time.perf_counter() - start
+        finally:
+            timer.cancel()
+
+    if wall >= timeout:
+        return wall, rss, 'timeout'
+    with open(os.path.join(workdir, 'stdout.txt'), encoding='utf-8', errors='replace') as f:
+        # Betikler hataları "Hata oluştu" mesajıyla bildirir ve 0 ile çıkar
+        if proc.returncode != 0 or 'Hata oluştu' in f.read():
+            return wall, rss, 'error'
+    return wall, rss, 'ok'
+
+
+def fit_exponent(points, fit_from=10000):
+    """(n, süre) noktalarına log(süre) = k log(n) + c doğrusunu uydurup k'yı döndürür.
+
+    Küçük boyutlarda süre yorumlayıcı açılışıyla baskın olduğundan sadece n >= fit_from
+    noktaları kullanılır (en az iki nokta yoksa tüm noktalar).
+    """
+    usable = [(n, t) for n, t in points if n >= fit_from and t > 0]
+    if len(usable) < 2:
+        usable = [(n, t) for n, t in points if t > 0]
+    if len(usable) < 2:
+        return None
+    xs = [math.log(n) for n, _ in usable]
+    ys = [math.log(t) for _, t in usable]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    if sxx == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sxx
+
+
+def default_harness_args(command):
+    return list(HARNESS_ARGS) if command == DEFAULT_COMMAND else []
+
+
+def run_benchmark(config, command=DEFAULT_COMMAND, extra_args=(), repeat=1, timeout=600.0, log=print,
+                  harness_args=None):
+    """Tüm durum ve boyutları ölçer; JSON'a yazılacak sonuç sözlüğünü döndürür.
+
+    harness_args verilmezse yalnızca yerleşik komut şablonuna HARNESS_ARGS eklenir.
+    """
+    if harness_args is None:
+        harness_args = default_harness_args(command)
+    harness_args = list(harness_args)
+    cases = build_cases(config['algorithms'], config['quanta'])
+    results = {name: {'runs': [], 'exponent': None} for name, _, _ in cases}
+    stopped = set() # Zaman aşımına uğrayan durumlar daha büyük boyutlarda denenmez
+
+    root = tempfile.mkdtemp(prefix='benchmark_')
+    try:
+        for n in config['sizes']:
+            trace = os.path.join(root, f"iz_{n}.csv")
+            rows = generate_rows(n, config['seed'], rate=config['rate'], mean_burst=config['mean_burst'])
+            write_workload(trace, rows)
+
+            for name, script, args in cases:
+                if name in stopped:
+                    continue
+                best = None
+                for _ in range(repeat):
+                    workdir = tempfile.mkdtemp(dir=root)
+                    argv = make_command(command, script, trace, args + harness_args + list(extra_args))
+                    wall, rss, status = run_once(argv, workdir, timeout)
+                    switches = context_switches(workdir) if status == 'ok' else None
+                    shutil.rmtree(workdir, ignore_errors=True)
+                    run = {'n': n, 'wall': round(wall, 4), 'peak_rss_mb': rss and round(rss, 1), 'status': status}
+                    if status == 'ok':
+                        events = 2 * n + (switches or 0)
+                        run['events'] = events
+                        run['events_per_sec'] = round(events / wall, 1)
+                    # Tekrarlarda en kısa süre tutulur, bellek için en yüksek değer
+                    if best is None or (status == 'ok' and (best['status'] != 'ok' or wall < best['wall'])):
+                        peak = best and best['peak_rss_mb']
+                        best = run
+                        if peak and rss:
+                            best['peak_rss_mb'] = max(best['peak_rss_mb'], peak)
+                    if status != 'ok':
+                        break
+                results[name]['runs'].append(best)
+                log(f"{name:<22} n={n:<9} {best['status']:<8} {best['wall']:9.3f} s  "
+                    f"{best.get('events_per_sec', 0):12.0f} olay/s  {best['peak_rss_mb'] or 0:8.1f} MB")
+                if best['status'] != 'ok':
+                    stopped.add(name)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    for data in results.values():
+        points = [(r['n'], r['wall']) for r in data['runs'] if r['status'] == 'ok']
+        exponent = fit_exponent(points)
+        data['exponent'] = exponent if exponent is None else round(exponent, 3)
+
+    return {
+        'version': FORMAT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': {'python': platform.python_version(), 'platform': platform.platform(),
+                        'machine': platform.machine(), 'cpus': os.cpu_count()},
+        'command': command,
+        'harness_args': harness_args,
+        'extra_args': list(extra_args),
+        'config': config,
+        'results': results,
+    }
+
+
+def compare(base, current, threshold=0.25, min_time=0.5, exponent_threshold=0.2):
+    """İki benchmark sonucunu karşılaştırır; (rapor satırları, gerileme sayısı) döndürür.
+
+    Taban süresi min_time'dan kısa koşular gürültü nedeniyle gerileme sayılmaz.
+    """
+    lines = ["Benchmark Karşılaştırması (yeni / taban)", "-" * 40]
+    # harness_args alanı olmayan eski sonuçlar önbellek bayrakları olmadan ölçülmüştür
+    old_args, new_args = base.get('harness_args', []), current.get('harness_args', [])
+    if old_args != new_args:
+        lines.append(f"UYARI: ölçümler farklı koşu argümanlarıyla alınmış ({' '.join(old_args) or '-'} / "
+                     f"{' '.join(new_args) or '-'}); süreler doğrudan karşılaştırılamayabilir")
+    regressions = 0
+    for name, base_data in base['results'].items():
+        data = current['results'].get(name)
+        if data is None:
+            continue
+        runs = {r['n']: r for r in data['runs']}
+        for b in base_data['runs']:
+            r = runs.get(b['n'])
+            if r is None or b['status'] != 'ok':
+                continue
+            if r['status'] != 'ok':
+                regressions += 1
+                lines.append(f"{name:<22} n={b['n']:<9} {r['status']}  <-- GERİLEME")
+                continue
+            ratio = r['wall'] / b['wall']
+            flag = ''
+            if ratio > 1 + threshold and b['wall'] >= min_time:
+                regressions += 1
+                flag = '  <-- GERİLEME'
+            lines.append(f"{name:<22} n={b['n']:<9} {b['wall']:9.3f} s -> {r['wall']:9.3f} s  "
+                         f"x{ratio:.2f}{flag}")
+        old, new = base_data['exponent'], data['exponent']
+        if old is not None and new is not None:
+            flag = ''
+            if new - old > exponent_threshold:
+                regressions += 1
+                flag = '  <-- GERİLEME'
+            lines.append(f"{name:<22} üs: {old:.3f} -> {new:.3f}{flag}")
+    lines.append("")
+    lines.append(f"Gerileme sayısı: {regressions} (eşik: süre +%{threshold * 100:.0f}, üs +{exponent_threshold})")
+    return lines, regressions
+
+
+def summary_lines(result):
+    lines = ["Ölçeklenme Kıyaslaması", "-" * 40]
+    for name, data in result['results'].items():
+        exponent = data['exponent']
+        largest = [r for r in data['runs'] if r['status'] == 'ok']
+        tail = f", n={largest[-1]['n']}: {largest[-1]['wall']:.3f} s" if largest else ''
+        lines.append(f"{name:<22} üs: {'-' if exponent is None else f'{exponent:.3f}'}{tail}")
+    return lines
+
+
+def load_result(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Çizelgeleme Algoritmaları Ölçeklenme Kıyaslaması")
+    parser.add_argument('--sizes', nargs='+', type=int, default=None,
+                        help='İz boyutları (Varsayılan: 100 1000 10000 100000 1000000)')
+    parser.add_argument('--algorithms', nargs='+', choices=list(SCRIPTS), default=None,
+                        help='Ölçülecek algoritmalar (Varsayılan: altı temel algoritma)')
+    parser.add_argument('--quanta', nargs='+', type=int, default=None,
+                        help='Round Robin quantum değerleri (Varsayılan: 2 10 50)')
+    parser.add_argument('--seed', type=int, default=None, help='İz üreteci tohumu (Varsayılan: 0)')
+    parser.add_argument('--rate', type=float, default=None, help='Varış hızı (Varsayılan: 0.18)')
+    parser.add_argument('--mean-burst', type=float, default=None, help='Ortalama süre (Varsayılan: 5)')
+    parser.add_argument('--repeat', type=int, default=1, help='Koşu tekrar sayısı; en kısa süre alınır (Varsayılan: 1)')
+    parser.add_argument('--timeout', type=float, default=600.0,
+                        help='Koşu başına zaman aşımı (sn); aşan durum büyük boyutlarda atlanır (Varsayılan: 600)')
+    parser.add_argument('--extra-args', type=str, default='',
+                        help="Her betiğe eklenecek argümanlar (ör. --extra-args='--fast-forward')")
+    parser.add_argument('--command', type=str, default=DEFAULT_COMMAND,
+                        help='Komut şablonu; {python}, {script}, {name}, {src}, {input} yer tutucuları '
+                             f'(Varsayılan: "{DEFAULT_COMMAND}")')
+    parser.add_argument('--harness-args', type=str, default=None,
+                        help='Her koşuya eklenen önbellek bayrakları; boş dize hiçbirini eklemez '
+                             f'(Varsayılan: yerleşik şablonda "{" ".join(HARNESS_ARGS)}", --command ile boş)')
+    parser.add_argument('-o', '--output', type=str, default='benchmark_sonuc.json',
+                        help='Sonuç JSON dosyası (Varsayılan: benchmark_sonuc.json)')
+    parser.add_argument('--compare', nargs='?', const=BASELINE, default=None, metavar='TABAN',
+                        help='Sonuçları taban çizgisiyle karşılaştır (Varsayılan: reports/benchmark_baseline.json)')
+    parser.add_argument('--current', type=str, default=None, metavar='JSON',
+                        help='Yeniden ölçmek yerine bu sonuç dosyasını karşılaştır (--compare ile)')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Gerileme eşiği: süredeki göreli artış (Varsayılan: 0.25 = %%25)')
+    parser.add_argument('--min-time', type=float, default=0.5,
+                        help='Bu süreden kısa taban koşuları gerileme sayılmaz (Varsayılan: 0.5 sn)')
+    args = parser.parse_args(argv)
+    if args.current and not args.compare:
+        parser.error("--current, --compare ile birlikte kullanılmalıdır")
+    if args.repeat < 1 or args.timeout <= 0:
+        parser.error("--repeat ve --timeout pozitif olmalıdır")
+
+    try:
+        base = load_result(args.compare) if args.compare else None
+        if args.current:
+            current = load_result(args.current)
+        else:
+            # Karşılaştırmada verilmeyen ayarlar taban çizgisinden alınır, böylece aynı izler ölçülür
+            config = {}
+            for key, default in DEFAULTS.items():
+                value = getattr(args, key)
+                if value is None:
+                    value = base['config'][key] if base else default
+                config[key] = value
+            harness_args = None if args.harness_args is None else shlex.split(args.harness_args)
+            current = run_benchmark(config, args.command, shlex.split(args.extra_args), args.repeat, args.timeout,
+                                    harness_args=harness_args)
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(current, f, ensure_ascii=False, indent=2)
+            print()
+            print("\n".join(summary_lines(current)))
+            print(f"Sonuçlar '{args.output}' dosyasına yazıldı.")
+
+        if base is not None:
+            lines, regressions = compare(base, current, args.threshold, args.min_time)
+            print()
+            print("\n".join(lines))
+            if regressions:
+                sys.exit(1)
+    except Exception as e:
+        print(f"Hata oluştu: {e}")
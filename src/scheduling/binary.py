@@ -0,0 +1,242 @@
+# Sıkıştırılmış ikili (binary) sonuç biçimi.
+# Metin çıktısı .4g biçimlendirmesiyle hassasiyet kaybeder ve geri okunması yavaştır.
+# Bu biçim aynı bilgiyi sabit genişlikli kayıtlarla tutar:
+#
+#   [ön başlık, 64 bayt] [zaman dilimleri] [işlem tablosu] [üst veri (JSON)]
+#
+#   - Ön başlık: sihirli dizi, sürüm ve diğer bölümlerin konum/uzunlukları
+#   - Zaman dilimi: (başlangıç f8, bitiş f8, işlem indeksi i4, tür i4) = 24 bayt;
+#     Round Robin tur blokları tek tek dilimlere açılmış olarak yazılır
+#   - İşlem tablosu: işlem başına varış, süre, öncelik, tamamlanma, ilk çalışma,
+#     turnaround ve bekleme (7 x f8)
+#   - Üst veri: algoritma, parametreler, girdi adı, işlem kimlikleri ve a-f metrikleri
+#
+# Yazma tarafı sadece standart kütüphaneyi kullanır; okuma tarafı bölümleri NumPy
+# memmap dizileri olarak açar, böylece milyonlarca dilim kopyalanmadan incelenebilir.
+
+import argparse
+import json
+import os
+import struct
+
+from .engine import CONTEXT_SWITCH, Simulator
+from .profiling import phase
+from .report import entry_lines
+from .timeline import IDLE, ROUND, expand_rounds
+from .writer import COMPRESSION_SUFFIXES, ReportWriter, StreamingTimeline
+
+MAGIC = b'SCHEDBIN'
+VERSION = 1
+
+# magic, sürüm, ayrılmış, dilim konumu/sayısı, işlem konumu/sayısı, üst veri konumu/uzunluğu
+PREAMBLE = struct.Struct('<8sIIQQQQQQ')
+SLICE = struct.Struct('<ddii')
+PROCESS = struct.Struct('<7d')
+
+# Dilim türleri
+KIND_RUN = 0
+KIND_IDLE = 1
+
+SLICE_FIELDS = [('start', '<f8'), ('end', '<f8'), ('index', '<i4'), ('kind', '<i4')]
+PROCESS_FIELDS = [('arrival', '<f8'), ('burst', '<f8'), ('priority', '<f8'), ('completion', '<f8'),
+                  ('first_start', '<f8'), ('turnaround', '<f8'), ('waiting', '<f8')]
+
+
+class BinaryTimeline(StreamingTimeline):
+    """Kesinleşen zaman dilimlerini metin yerine sabit genişlikli kayıt olarak yazar."""
+
+    def __init__(self, writer, ids):
+        super().__init__(None, ids)
+        self.writer = writer
+
+    def emit_entry(self, entry, ids):
+        start, idx, end = entry[0], entry[1], entry[2]
+        if idx == ROUND:
+            for s, i, e in expand_rounds(entry):
+                self.writer.write_slice(s, e, i, KIND_RUN)
+        elif idx == IDLE:
+            self.writer.write_slice(start, end, -1, KIND_IDLE)
+        else:
+            self.writer.write_slice(start, end, idx, KIND_RUN)
+
+
+class BinaryWriter:
+    """Dilimleri tamponlayarak yazar; işlem tablosu ve üst veri en sonda eklenir."""
+
+    def __init__(self, path, buffer_records=8192, profiler=None):
+        self.path = path
+        self.profiler = profiler
+        self.f = open(path, "wb")
+        # Ön başlık bölüm konumları bilindiğinde (close) yeniden yazılır
+        self.f.write(bytes(PREAMBLE.size))
+        self.buffer = []
+        self.buffer_records = buffer_records
+        self.slice_count = 0
+        self.proc_offset = self.proc_count = 0
+        self.meta_offset = self.meta_len = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write_slice(self, start, end, index, kind):
+        self.buffer.append(SLICE.pack(start, end, index, kind))
+        self.slice_count += 1
+        if len(self.buffer) >= self.buffer_records:
+            self.flush()
+
+    def write_processes(self, result):
+        # Turnaround = Completion - Arrival, Waiting = Turnaround - Burst
+        self.flush()
+        table = result.table
+        self.proc_offset = self.f.tell()
+        self.proc_count = len(table)
+        nan = float('nan')
+        for i in range(len(table)):
+            turnaround = result.completion[i] - table.arrival[i]
+            priority = table.priority[i] if table.has_priority else nan
+            self.buffer.append(PROCESS.pack(table.arrival[i], table.burst[i], priority, result.completion[i],
+                                            result.first_start[i], turnaround, turnaround - table.burst[i]))
+            if len(self.buffer) >= self.buffer_records:
+                self.flush()
+        self.flush()
+
+    def write_meta(self, meta):
+        self.flush()
+        data = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+        self.meta_offset = self.f.tell()
+        self.meta_len = len(data)
+        self.f.write(data)
+
+    def flush(self):
+        if self.buffer:
+            with phase(self.profiler, 'write'):
+                self.f.write(b"".join(self.buffer))
+                self.buffer = []
+
+    def close(self):
+        with phase(self.profiler, 'write'):
+            self.flush()
+            self.f.seek(0)
+            self.f.write(PREAMBLE.pack(MAGIC, VERSION, 0, PREAMBLE.size, self.slice_count,
+                                       self.proc_offset, self.proc_count, self.meta_offset, self.meta_len))
+            self.f.close()
+
+
+def write_binary_run(policy, table, input_path, filename, columns=None, context_switch=CONTEXT_SWITCH,
+                     percentiles=None, curve=None, profiler=None):
+    """cli.write_run'ın ikili karşılığı: simüle eder, dosyayı yazar ve metrikleri döndürür."""
+    from .cli import result_metrics
+
+    with BinaryWriter(filename, profiler=profiler) as writer:
+        timeline = BinaryTimeline(writer, table.ids)
+        sim = Simulator(table, policy, context_switch, timeline)
+        if profiler is not None:
+            profiler.instrument(sim)
+        with phase(profiler, 'simulate'):
+            result = sim.run()
+            timeline.flush()
+        with phase(profiler, 'metrics'):
+            metrics = result_metrics(result, columns, percentiles, curve)
+
+        with phase(profiler, 'write'):
+            writer.write_processes(result)
+            writer.write_meta({
+                'algorithm': policy.name,
+                'title': policy.title(),
+                'params': policy.params(),
+                'context_switch': context_switch,
+                'input': os.path.basename(input_path),
+                'end_time': result.end_time,
+                'ids': [str(p_id) for p_id in table.ids],
+                'metrics': metrics,
+            })
+    return metrics
+
+
+class BinaryResult:
+    """İkili sonuç dosyası; dilimler ve işlem tablosu NumPy memmap dizileridir."""
+
+    def __init__(self, path):
+        import numpy as np
+
+        with open(path, "rb") as f:
+            fields = PREAMBLE.unpack(f.read(PREAMBLE.size))
+            magic, version, _, slice_offset, slice_count, proc_offset, proc_count, meta_offset, meta_len = fields
+            if magic != MAGIC:
+                raise ValueError(f"'{path}' bir ikili sonuç dosyası değil.")
+            if version != VERSION:
+                raise ValueError(f"Desteklenmeyen ikili biçim sürümü: {version}")
+            f.seek(meta_offset)
+            self.meta = json.loads(f.read(meta_len).decode("utf-8"))
+
+        self.path = path
+        self.slices = self._map(np, SLICE_FIELDS, slice_offset, slice_count)
+        self.processes = self._map(np, PROCESS_FIELDS, proc_offset, proc_count)
+
+    def _map(self, np, fields, offset, count):
+        # Boş bölüm eşlenemez (mmap sıfır uzunluk kabul etmez)
+        if count == 0:
+            return np.empty(0, dtype=fields)
+        return np.memmap(self.path, dtype=fields, mode='r', offset=offset, shape=(count,))
+
+    @property
+    def ids(self):
+        return self.meta['ids']
+
+    @property
+    def metrics(self):
+        # JSON anahtarları metin olduğundan throughput kontrol noktaları tamsayıya çevrilir
+        metrics = dict(self.meta['metrics'])
+        metrics['throughput'] = {int(t): c for t, c in metrics['throughput'].items()}
+        return metrics
+
+
+def read_binary(path):
+    """İkili sonuç dosyasını açar (kopyalamadan, bellek eşlemeli)."""
+    return BinaryResult(path)
+
+
+def timeline_lines(data, chunk=65536):
+    # Zaman tablosu satırları (tur blokları açılmış, 'expanded' biçimde).
+    # Dilimler parça parça Python listelerine çevrilir; bellek kullanımı parça boyutuyla sınırlıdır.
+    ids = data.ids
+    slices = data.slices
+    for pos in range(0, len(slices), chunk):
+        part = slices[pos:pos + chunk]
+        for start, end, index in zip(part['start'].tolist(), part['end'].tolist(), part['index'].tolist()):
+            yield from entry_lines((start, index, end), ids)
+
+
+def to_text(path, output_path, compression=None):
+    """İkili sonuç dosyasından metin sonuç dosyasını yeniden üretir."""
+    data = read_binary(path)
+    with ReportWriter(output_path, compression) as writer:
+        writer.write_header(data.meta['title'], data.meta['input'])
+        for line in timeline_lines(data):
+            writer.write_line(line)
+        writer.write_summary(data.metrics)
+    return output_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="İkili sonuç dosyasını metin biçimine çevir")
+    parser.add_argument('input_file', type=str, help='İkili sonuç dosyası (.bin)')
+    parser.add_argument('-o', '--output', type=str, default=None,
+                        help='Metin çıktı dosyası (Varsayılan: aynı ad, .txt uzantılı)')
+    parser.add_argument('--compress', choices=list(COMPRESSION_SUFFIXES), default=None,
+                        help='Metin çıktısını sıkıştırarak yaz')
+    args = parser.parse_args(argv)
+
+    try:
+        output = args.output
+        if output is None:
+            output = os.path.splitext(args.input_file)[0] + ".txt"
+            if args.compress:
+                output += COMPRESSION_SUFFIXES[args.compress]
+        to_text(args.input_file, output, args.compress)
+        print(f"İşlem Tamamlandı. Sonuçlar '{output}' dosyasına yazıldı.")
+    except Exception as e:
+        print(f"Hata oluştu: {e}")
@@ -0,0 +1,199 @@
+# İçerik adresli sonuç önbelleği.
+# Aynı girdi dosyası aynı algoritma ve parametrelerle tekrar çalıştırıldığında simülasyon
+# yapılmaz; önceki koşunun sonuç dosyaları (zaman tablosu ve a-f metrikleri) önbellekten kopyalanır.
+#
+# Anahtar, şunların SHA-256 özetidir:
+#   - girdi dosyasının içeriği (adı veya değiştirilme zamanı değil)
+#   - algoritma adı, parametreleri ve bağlam değiştirme süresi
+#   - çıktıyı etkileyen seçenekler (zaman tablosu gösterimi, biçim, sıkıştırma, yüzdelikler, ...)
+#   - ENGINE_VERSION ve paket kaynak kodunun özeti (kod değişince eski kayıtlar kullanılmaz)
+#
+# Her kayıt önbellek dizininde anahtar adlı bir klasördür. Kullanılan kaydın zamanı güncellenir;
+# toplam boyut sınırı aşılınca en uzun süredir kullanılmayan (LRU) kayıtlar silinir.
+# Ayrıştırılmış izler (sidecar.py) aynı dizinin 'izler' alt klasöründe tutulur.
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from .engine import CONTEXT_SWITCH, ENGINE_VERSION
+
+DEFAULT_MAX_MB = 256
+STAMP = 'metrics.json' # Kaydın son kullanım zamanı bu dosyanın mtime değeridir
+TRACE_DIR = 'izler'
+
+_SOURCE_DIGEST = None
+
+
+def default_directory():
+    # SCHED_CACHE_DIR > XDG_CACHE_HOME/eblm341_scheduling > ~/.cache/eblm341_scheduling
+    if os.environ.get('SCHED_CACHE_DIR'):
+        return os.environ['SCHED_CACHE_DIR']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'eblm341_scheduling')
+
+
+def trace_directory(directory=None):
+    # Ayrıştırılmış iz önbelleğinin dizini
+    return os.path.join(directory or default_directory(), TRACE_DIR)
+
+
+def file_digest(path, chunk=1 << 20):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def source_digest():
+    # Paket kaynak kodunun özeti; süreç başına bir kez hesaplanır
+    global _SOURCE_DIGEST
+    if _SOURCE_DIGEST is None:
+        package = os.path.dirname(os.path.abspath(__file__))
+        h = hashlib.sha256()
+        for name in sorted(os.listdir(package)):
+            if name.endswith('.py'):
+                h.update(name.encode())
+                with open(os.path.join(package, name), 'rb') as f:
+                    h.update(f.read())
+        _SOURCE_DIGEST = h.hexdigest()
+    return _SOURCE_DIGEST
+
+
+def _tree_size(path):
+    return sum(os.path.getsize(os.path.join(root, name))
+               for root, _, names in os.walk(path) for name in names)
+
+
+class ResultCache:
+    """Sonuç dosyalarını ve metrikleri anahtar başına saklayan, boyut sınırlı LRU önbellek."""
+
+    def __init__(self, directory=None, max_mb=DEFAULT_MAX_MB):
+        self.directory = directory or default_directory()
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._digests = {}
+
+    def key(self, input_path, policy, context_switch=CONTEXT_SWITCH, **options):
+        """Girdi içeriği, politika ve çıktı seçeneklerinden önbellek anahtarı üretir."""
+        path = os.path.abspath(input_path)
+        if path not in self._digests:
+            self._digests[path] = file_digest(path)
+        material = {
+            'input': self._digests[path],
+            # Sonuç dosyasının başlığında girdi dosyasının adı yazılır
+            'input_name': os.path.basename(input_path),
+            'algorithm': policy.name,
+            'params': policy.params(),
+            'context_switch': context_switch,
+            'engine': ENGINE_VERSION,
+            'source': source_digest(),
+            'options': options,
+        }
+        data = json.dumps(material, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(data).hexdigest()
+
+    def _entry(self, key):
+        return os.path.join(self.directory, key)
+
+    def get(self, key, outputs):
+        """Kayıt varsa dosyaları outputs'taki (rol -> yol) konumlara kopyalar ve metrikleri döndürür.
+
+        Kayıt yoksa (veya eksikse) None döndürür.
+        """
+        entry = self._entry(key)
+        stamp = os.path.join(entry, STAMP)
+        try:
+            with open(stamp, encoding='utf-8') as f:
+                metrics = json.load(f)
+            for role, path in outputs.items():
+                if path is not None:
+                    shutil.copyfile(os.path.join(entry, role), path)
+        except (OSError, ValueError):
+            return None
+        os.utime(stamp) # LRU: son kullanım zamanı
+        # JSON anahtarları metin olduğundan throughput kontrol noktaları tamsayıya çevrilir
+        if metrics and 'throughput' in metrics:
+            metrics['throughput'] = {int(t): c for t, c in metrics['throughput'].items()}
+        return metrics
+
+    def put(self, key, outputs, metrics=None):
+        """Üretilen dosyaları kaydeder; ardından boyut sınırına göre eski kayıtları siler."""
+        os.makedirs(self.directory, exist_ok=True)
+        entry = self._entry(key)
+        # Kayıt geçici klasörde hazırlanıp tek adımda yerine taşınır; yarım kayıt okunmaz
+        staging = tempfile.mkdtemp(dir=self.directory, prefix='.yeni_')
+        try:
+            for role, path in outputs.items():
+                if path is not None:
+                    shutil.copyfile(path, os.path.join(staging, role))
+            with open(os.path.join(staging, STAMP), 'w', encoding='utf-8') as f:
+                json.dump(metrics or {}, f, ensure_ascii=False)
+            if os.path.isdir(entry):
+                shutil.rmtree(entry, ignore_errors=True)
+            os.replace(staging, entry)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+        self.evict()
+
+    def entries(self):
+        # (son kullanım zamanı, boyut, yol) listesi
+        result = []
+        if not os.path.isdir(self.directory):
+            return result
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            stamp = os.path.join(path, STAMP)
+            if name.startswith('.') or not os.path.isfile(stamp):
+                continue
+            result.append((os.path.getmtime(stamp), _tree_size(path), path))
+        return result
+
+    def evict(self):
+        """Toplam boyut sınırın altına inene kadar en eski kayıtları siler."""
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """Tüm kayıtları ve ayrıştırılmış izleri siler; silinen kayıt sayısını döndürür."""
+        entries = self.entries()
+        for _, _, path in entries:
+            shutil.rmtree(path, ignore_errors=True)
+        shutil.rmtree(trace_directory(self.directory), ignore_errors=True)
+        return len(entries)
+
+
+def add_cache_arguments(parser):
+    group = parser.add_argument_group('Sonuç önbelleği')
+    group.add_argument('--no-cache', action='store_true',
+                       help='Önbelleği kullanma: her zaman simüle et ve sonucu kaydetme')
+    group.add_argument('--clear-cache', action='store_true', help='Çalıştırmadan önce önbelleği temizle')
+    group.add_argument('--cache-dir', type=str, default=None,
+                       help='Önbellek dizini (Varsayılan: $SCHED_CACHE_DIR veya ~/.cache/eblm341_scheduling)')
+    group.add_argument('--cache-size', type=float, default=DEFAULT_MAX_MB, metavar='MB',
+                       help=f'Önbelleğin en büyük toplam boyutu, MB (Varsayılan: {DEFAULT_MAX_MB})')
+    group.add_argument('--no-trace-cache', action='store_true',
+                       help='Ayrıştırılmış ikili iz önbelleğini (izler/*.trace.bin) okuma ve yazma')
+
+
+def trace_cache_from_args(args):
+    """load_processes için trace_cache değeri: kapalıysa False, değilse iz dizini."""
+    return False if args.no_trace_cache else trace_directory(args.cache_dir)
+
+
+def cache_from_args(args, enabled=True):
+    """--clear-cache'i uygular; önbellek kullanılacaksa ResultCache, değilse None döndürür."""
+    cache = ResultCache(args.cache_dir, args.cache_size)
+    if args.clear_cache:
+        print(f"Önbellek temizlendi ({cache.clear()} kayıt silindi).")
+    if args.no_cache or not enabled:
+        return None
+    return cache
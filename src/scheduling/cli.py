@@ -0,0 +1,209 @@
+# Algoritma betiklerinin (fcfs.py, round_robin.py, ...) ortak komut satırı akışı.
+
+import argparse
+import os
+
+from .cache import add_cache_arguments, cache_from_args, trace_cache_from_args
+from .engine import Simulator
+from .loader import load_processes
+from .metrics import LATENCY_MODES, ThroughputCurve, latency_metrics
+from .profiling import PROFILE_MODES, Profiler, phase
+from .report import compute_metrics, write_throughput_csv
+from .writer import COMPRESSION_SUFFIXES, ReportWriter, StreamingTimeline
+
+
+OUTPUT_FORMATS = ['text', 'binary']
+
+
+def output_filename(policy, input_path, tag='', compression=None, output_format='text'):
+    # Çıktı dosya ismi formatı: sonuc_<algoritma>_<dosya>.txt (ör. sonuc_fcfs_case1.txt)
+    # tag, aynı algoritmanın farklı parametrelerle koşularını ayırır (ör. '_q20');
+    # sıkıştırmada uygun uzantı eklenir (ör. .txt.gz), ikili biçim .bin uzantılıdır
+    raw_name = os.path.splitext(os.path.basename(input_path))[0]
+    if output_format == 'binary':
+        return f"sonuc_{policy.output_prefix}{tag}_{raw_name}.bin"
+    suffix = COMPRESSION_SUFFIXES[compression] if compression else ''
+    return f"sonuc_{policy.output_prefix}{tag}_{raw_name}.txt{suffix}"
+
+
+def throughput_filename(policy, input_path):
+    # İş tamamlama eğrisi dosyası: throughput_<algoritma>_<dosya>.csv
+    raw_name = os.path.splitext(os.path.basename(input_path))[0]
+    return f"throughput_{policy.output_prefix}_{raw_name}.csv"
+
+
+def run_cache_key(cache, policy, input_path, timeline_mode='expanded', output_format='text', compression=None,
+                  percentiles=None, throughput_at=None, throughput_step=None, cpus=1, queue=None):
+    # Betikler ve compare_all aynı koşu için aynı önbellek anahtarını üretir
+    return cache.key(input_path, policy, timeline=timeline_mode, format=output_format, compress=compression,
+                     percentiles=percentiles, throughput_at=throughput_at, throughput_step=throughput_step,
+                     cpus=cpus, queue=queue)
+
+
+def result_metrics(result, columns=None, percentiles=None, curve=None):
+    # Sütunlu tablo varsa metrikler vektörel hesaplanır;
+    # percentiles ('exact'/'sketch') verilirse gecikme yüzdelikleri,
+    # curve (ThroughputCurve) verilirse ek throughput noktaları da eklenir
+    if columns is not None:
+        from . import columnar as col
+        metrics = col.compute_metrics(columns, result)
+    else:
+        metrics = compute_metrics(result)
+    if percentiles:
+        metrics['latency'] = latency_metrics(result, percentiles)
+    if curve is not None:
+        metrics['throughput_curve'] = curve.evaluate(result.completion, result.end_time)
+    return metrics
+
+
+def write_run(policy, table, input_path, filename, timeline_mode='expanded', compression=None, columns=None,
+              output_format='text', percentiles=None, curve=None, profiler=None):
+    """Simülasyonu çalıştırırken zaman tablosunu doğrudan dosyaya akıtır; metrikleri döndürür."""
+    if output_format == 'binary':
+        from .binary import write_binary_run
+        return write_binary_run(policy, table, input_path, filename, columns,
+                                percentiles=percentiles, curve=curve, profiler=profiler)
+
+    with ReportWriter(filename, compression, profiler=profiler) as writer:
+        writer.write_header(policy.title(), os.path.basename(input_path))
+        timeline = StreamingTimeline(writer.write_line, table.ids, timeline_mode)
+        sim = Simulator(table, policy, timeline=timeline)
+        if profiler is not None:
+            profiler.instrument(sim)
+        with phase(profiler, 'simulate'):
+            result = sim.run()
+            timeline.flush()
+        with phase(profiler, 'metrics'):
+            metrics = result_metrics(result, columns, percentiles, curve)
+        writer.write_summary(metrics)
+    return metrics
+
+
+def load_for_policy(policy, input_path, columnar=False, trace_cache=True):
+    # (süreç tablosu, sütunlu tablo veya None) döndürür
+    if columnar:
+        # NumPy sadece istenirse içe aktarılır
+        from . import columnar as col
+        columns = col.load_columnar(input_path, require_priority=policy.needs_priority, trace_cache=trace_cache)
+        return columns.to_process_table(), columns
+    return load_processes(input_path, require_priority=policy.needs_priority, trace_cache=trace_cache), None
+
+
+def run_policy(policy, input_path, timeline_mode='expanded', columnar=False, compression=None,
+               output_format='text', percentiles=None, curve=None, profiler=None, trace_cache=True):
+    """Dosyayı yükler, simüle eder ve sonuç dosyasını yazar; (dosya adı, metrikler) döndürür."""
+    with phase(profiler, 'load'):
+        table, columns = load_for_policy(policy, input_path, columnar, trace_cache)
+    filename = output_filename(policy, input_path, compression=compression, output_format=output_format)
+    metrics = write_run(policy, table, input_path, filename, timeline_mode, compression, columns, output_format,
+                        percentiles, curve, profiler)
+    if curve is not None:
+        with phase(profiler, 'write'):
+            write_throughput_csv(throughput_filename(policy, input_path), metrics['throughput_curve'])
+    return filename, metrics
+
+
+def main(policy_cls, argv=None):
+    parser = argparse.ArgumentParser(description=policy_cls.description)
+    parser.add_argument('input_file', type=str, help='İşlenecek CSV dosyasının yolu')
+    policy_cls.add_arguments(parser)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--columnar', action='store_true',
+                      help='NumPy sütunlu tablo ve vektörel metrik hesabı kullan (NumPy gerektirir)')
+    mode.add_argument('--stream', action='store_true',
+                      help='Dosyayı satır satır oku, sınırlı bellekle simüle et (varışa göre sıralı dosya gerekir)')
+    parser.add_argument('--compress', choices=list(COMPRESSION_SUFFIXES), default=None,
+                        help='Sonuç dosyasını sıkıştırarak yaz (zstd için zstandard paketi gerekir)')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='text',
+                        help='Sonuç dosyası biçimi; binary: sabit genişlikli kayıtlar (Varsayılan: text)')
+    parser.add_argument('--percentiles', nargs='?', const='auto', choices=['auto'] + LATENCY_MODES, default=None,
+                        help='Bekleme/tamamlanma/yanıt süresi P50/P95/P99 ve öncelik sınıfı dökümü ekle '
+                             '(exact: kesin, sketch: sabit bellekli histogram; varsayılan: akış modunda sketch)')
+    parser.add_argument('--throughput-at', nargs='+', type=float, default=None, metavar='T',
+                        help='Ek throughput kontrol noktaları (ör. --throughput-at 25 75 300)')
+    parser.add_argument('--throughput-step', type=float, default=None, metavar='S',
+                        help='Her S birimde bir throughput noktası (0, S, 2S, ... bitişe kadar)')
+    parser.add_argument('--cpus', type=int, default=1, metavar='M',
+                        help='Çekirdek sayısı; 1\'den büyükse çok çekirdekli (SMP) simülasyon yapılır (Varsayılan: 1)')
+    parser.add_argument('--queue', choices=['global', 'balance', 'steal'], default=None,
+                        help='Çok çekirdekli hazır kuyruğu düzeni; global: ortak kuyruk, balance: çekirdek kuyrukları '
+                             've yük dengeleme, steal: çekirdek kuyrukları ve iş çalma (Varsayılan: global)')
+    parser.add_argument('--profile', nargs='?', const='counters', choices=PROFILE_MODES, default=None,
+                        help='Aşama sürelerini (yükleme, simülasyon, metrikler, yazma) ve olay döngüsü sayaçlarını '
+                             'yazdır (phases: sadece aşama süreleri, düşük ek maliyet; varsayılan: counters)')
+    parser.add_argument('--profile-dump', type=str, default=None, metavar='DOSYA',
+                        help='Koşuyu cProfile ile izle ve pstats dosyasına yaz (--profile özetini de açar)')
+    add_cache_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.cpus < 1:
+        parser.error("--cpus 1 veya daha büyük olmalıdır")
+    smp = args.cpus > 1 or args.queue is not None
+    if smp and (args.stream or args.format == 'binary'):
+        parser.error("Çok çekirdekli mod --stream ve --format binary ile birlikte kullanılamaz")
+    if smp and (getattr(args, 'vectorized', False) or getattr(args, 'fast_forward', False)):
+        parser.error("Çok çekirdekli mod --vectorized ve --fast-forward ile birlikte kullanılamaz")
+    if args.throughput_step is not None and args.throughput_step <= 0:
+        parser.error("--throughput-step pozitif olmalıdır")
+    if args.percentiles == 'exact' and args.stream:
+        parser.error("--percentiles exact, --stream ile kullanılamaz (sabit bellek için sketch kullanılır)")
+    if args.percentiles == 'auto':
+        args.percentiles = 'sketch' if args.stream else 'exact'
+    if args.format == 'binary' and (args.stream or args.compress):
+        parser.error("--format binary, --stream ve --compress ile birlikte kullanılamaz")
+    if getattr(args, 'vectorized', False) and args.stream:
+        parser.error("--vectorized, --stream ile birlikte kullanılamaz (tüm tablo gerekir)")
+
+    try:
+        policy = policy_cls.from_args(args)
+        timeline_mode = getattr(args, 'timeline', 'expanded')
+        curve = None
+        if args.throughput_at or args.throughput_step:
+            curve = ThroughputCurve(args.throughput_at, args.throughput_step)
+        profiler = None
+        if args.profile or args.profile_dump:
+            profiler = Profiler(args.profile or 'counters', args.profile_dump)
+            profiler.start()
+
+        # Akış modu (büyük girdiler) ve profil koşuları önbelleği kullanmaz
+        cache = cache_from_args(args, enabled=not args.stream and profiler is None)
+        outputs = None
+        if cache is not None:
+            tag = f"_cpu{args.cpus}" if smp else ''
+            outputs = {
+                'result': output_filename(policy, args.input_file, tag, args.compress,
+                                          'text' if smp else args.format),
+                'throughput': throughput_filename(policy, args.input_file) if curve is not None else None,
+            }
+            key = run_cache_key(cache, policy, args.input_file, timeline_mode, args.format, args.compress,
+                                args.percentiles, args.throughput_at, args.throughput_step, args.cpus, args.queue)
+
+        metrics = None
+        hit = outputs is not None and cache.get(key, outputs) is not None
+        if hit:
+            filename = outputs['result']
+            print("Sonuç önbellekten alındı (simülasyon atlandı).")
+        elif smp:
+            from .smp import run_smp
+            filename, metrics = run_smp(policy, args.input_file, args.cpus, args.queue or 'global', args.columnar,
+                               args.compress, args.percentiles, curve, profiler,
+                               trace_cache=trace_cache_from_args(args))
+        elif args.stream:
+            from .streaming import run_streaming
+            filename = run_streaming(policy, args.input_file, timeline_mode, args.compress,
+                                     args.percentiles, curve, profiler)
+        else:
+            filename, metrics = run_policy(policy, args.input_file, timeline_mode,
+                                  args.columnar, args.compress, args.format, args.percentiles, curve, profiler,
+                                  trace_cache=trace_cache_from_args(args))
+        if outputs is not None and not hit:
+            # Metrikler de saklanır ki compare_all aynı koşuyu önbellekten kullanabilsin
+            cache.put(key, outputs, metrics)
+        if profiler is not None:
+            profiler.stop()
+            print("\n".join(profiler.report_lines()))
+            print()
+        if curve is not None:
+            print(f"Throughput eğrisi '{throughput_filename(policy, args.input_file)}' dosyasına yazıldı.")
+        print(f"İşlem Tamamlandı. Sonuçlar '{filename}' dosyasına yazıldı.")
+    except Exception as e:
+        print(f"Hata oluştu: {e}")
@@ -0,0 +1,163 @@
+# NumPy tabanlı sütunlu (columnar) süreç tablosu.
+# İşlem başına bir sözlük yerine her alan tek bir dizi olarak tutulur; öncelik eşlemesi
+# ve a-f metrikleri satır satır Python döngüsü yerine dizi işlemleriyle hesaplanır.
+# NumPy isteğe bağlıdır: bu modül sadece --columnar seçeneğiyle içe aktarılır.
+
+import numpy as np
+
+from .loader import bad_value_error, open_trace_cache, read_columns, save_trace_cache, trace_signature
+from .process_table import ProcessTable
+from .report import CHECK_POINTS
+from .ticks import TICKS_PER_UNIT
+
+PRIORITY_LABELS = {'high': 1, 'normal': 2, 'low': 3}
+UNKNOWN_PRIORITY = 999 # Bilinmeyen değer en düşük öncelik olsun
+
+
+def map_priority_array(values):
+    """map_priority'nin vektörel karşılığı: tüm sütunu tek geçişte sayısal koda çevirir."""
+    raw = np.asarray(values, dtype=str)
+    labels = np.char.lower(np.char.strip(raw))
+    codes = np.full(len(raw), float(UNKNOWN_PRIORITY))
+
+    is_label = np.zeros(len(raw), dtype=bool)
+    for label, code in PRIORITY_LABELS.items():
+        mask = labels == label
+        codes[mask] = code
+        is_label |= mask
+
+    # Etiket olmayanlar sayısal olarak yorumlanır; önce toplu dönüşüm denenir,
+    # başarısız olursa (karışık/bozuk değerler) sadece o kısım tek tek çevrilir
+    rest = np.flatnonzero(~is_label)
+    if len(rest):
+        try:
+            codes[rest] = raw[rest].astype(float)
+        except ValueError:
+            for k in rest:
+                try:
+                    codes[k] = float(raw[k])
+                except ValueError:
+                    pass
+    return codes
+
+
+def _to_float_array(values, column):
+    try:
+        return np.asarray(values, dtype=float)
+    except ValueError:
+        raise bad_value_error(values, column) from None
+
+
+class ColumnarTable:
+    """Süreç bilgileri ve koşu sonuçları için NumPy dizileri."""
+
+    def __init__(self, ids, arrival, burst, priority=None, order=None):
+        n = len(ids)
+        self.ids = ids
+        self.id_index = np.arange(n, dtype=np.int64)
+        self.arrival = np.asarray(arrival, dtype=float)
+        self.burst = np.asarray(burst, dtype=float)
+        self.priority = None if priority is None else np.asarray(priority, dtype=float)
+        # Varış zamanına göre kararlı sıralama (eşitlikte dosya sırası korunur)
+        self.order = np.argsort(self.arrival, kind='stable') if order is None else np.asarray(order)
+        self._process_table = None
+
+        # Koşu sonuçları (attach_result ile doldurulur)
+        self.remaining = self.burst.copy()
+        self.completion = np.zeros(n)
+        self.turnaround = np.zeros(n)
+        self.waiting = np.zeros(n)
+
+    def __len__(self):
+        return len(self.id_index)
+
+    def to_process_table(self):
+        # Simülasyon döngüsü tek tek eleman eriştiği için Python listeleri daha hızlıdır;
+        # tolist() dönüşümü tek seferlik ve vektöreldir (sonuç saklanır)
+        if self._process_table is None:
+            priority = None if self.priority is None else self.priority.tolist()
+            ticks = (np.rint(self.arrival * TICKS_PER_UNIT).astype(np.int64).tolist(),
+                     np.rint(self.burst * TICKS_PER_UNIT).astype(np.int64).tolist())
+            self._process_table = ProcessTable(self.ids, self.arrival.tolist(), self.burst.tolist(),
+                                               priority, order=self.order.tolist(), ticks=ticks)
+        return self._process_table
+
+    def attach_result(self, result):
+        # Turnaround = Completion - Arrival, Waiting = Turnaround - Burst
+        self.completion = np.asarray(result.completion, dtype=float)
+        self.remaining = np.where(self.completion > 0, 0.0, self.burst)
+        self.turnaround = self.completion - self.arrival
+        self.waiting = self.turnaround - self.burst
+
+
+def load_columnar(path, require_priority=False, trace_cache=True):
+    """CSV dosyasını okuyup bir ColumnarTable döndürür.
+
+    Geçerli bir sidecar varsa diziler ondan kopyalanmadan (memmap) açılır.
+    """
+    if trace_cache:
+        sidecar = open_trace_cache(path, require_priority, trace_cache)
+        if sidecar is not None:
+            try:
+                arrival, burst, priority, order = sidecar.arrays(np)
+                return ColumnarTable(sidecar.ids(), arrival, burst, priority, order=order)
+            finally:
+                sidecar.close()
+        signature = trace_signature(path)
+
+    columns = read_columns(path, require_priority)
+    priority = None
+    if columns['priority'] is not None:
+        priority = map_priority_array(columns['priority'])
+    table = ColumnarTable(columns['ids'],
+                          _to_float_array(columns['arrival'], 'Arrival_Time'),
+                          _to_float_array(columns['burst'], columns['burst_col']),
+                          priority)
+    if trace_cache and signature is not None:
+        save_trace_cache(path, table.to_process_table(), trace_cache, signature)
+    return table
+
+
+def fcfs_schedule(arrival, burst, context_switch, t0=0):
+    """Varış sırasındaki işlemler için FCFS çizelgesini kapalı formda hesaplar.
+
+    start_i = max(arrival_i, end_{i-1}) + CS, end_i = start_i + burst_i (end_{-1} = t0).
+    Girdiler tamsayı tick dizileridir; (start, end, idle) dizilerini döndürür. idle[i],
+    i. işlemden önce CPU'nun boşta kaldığını (arrival_i > end_{i-1}) gösterir.
+    """
+    arrival = np.asarray(arrival, dtype=np.int64)
+    burst = np.asarray(burst, dtype=np.int64)
+    if len(arrival) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.zeros(0, dtype=bool)
+
+    # S_i = sum_{j<=i}(CS + burst_j) ise end_i - S_i = max(t0, max_{j<=i}(arrival_j - S_{j-1})).
+    # Tamsayı toplamlar kesin olduğundan tek geçiş yeterlidir.
+    cost = context_switch + burst
+    total = np.cumsum(cost)
+    end = total + np.maximum(t0, np.maximum.accumulate(arrival - (total - cost)))
+    start = end - burst
+    idle = arrival > np.concatenate(([t0], end[:-1]))
+    return start, end, idle
+
+
+def compute_metrics(columns, result):
+    """report.compute_metrics ile aynı sözlüğü dizi indirgemeleriyle hesaplar."""
+    columns.attach_result(result)
+    n = len(columns)
+
+    # Tamamlanma zamanları bir kez sıralanır; her kontrol noktası ikili aramadır
+    completion_sorted = np.sort(columns.completion)
+    counts = np.searchsorted(completion_sorted, CHECK_POINTS, side='right')
+
+    total_burst = columns.burst.sum()
+    end_time = result.end_time
+
+    return {
+        'max_wait': float(columns.waiting.max()),
+        'avg_wait': float(columns.waiting.sum() / n),
+        'max_turnaround': float(columns.turnaround.max()),
+        'avg_turnaround': float(columns.turnaround.sum() / n),
+        'throughput': {t: int(c) for t, c in zip(CHECK_POINTS, counts)},
+        'cpu_efficiency': float(total_burst / end_time) if end_time > 0 else 0,
+        'context_switches': result.timeline.context_switches(),
+    }
@@ -0,0 +1,164 @@
+# Tüm algoritmaları tek bir CSV okumasıyla, paralel olarak çalıştırıp karşılaştırır.
+# Süreç tablosu işçilere bir kez aktarılır: 'fork' destekleniyorsa modül değişkeni
+# üzerinden copy-on-write paylaşılır, aksi halde her işçiye initializer ile bir kez gönderilir.
+
+import argparse
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .cache import add_cache_arguments, cache_from_args, trace_cache_from_args
+from .cli import OUTPUT_FORMATS, output_filename, run_cache_key, write_run
+from .loader import load_processes
+from .policies import POLICIES, RoundRobin
+from .report import CHECK_POINTS, write_report
+from .writer import COMPRESSION_SUFFIXES
+
+# İşçi süreçlerde paylaşılan süreç tablosu
+_TABLE = None
+
+
+def _init_worker(table):
+    global _TABLE
+    _TABLE = table
+
+
+def _run_task(policy, input_path, filename, compression=None, output_format='text'):
+    # Tek bir politikayı paylaşılan tablo üzerinde çalıştırır, sonuç dosyasını
+    # işçide yazar ve ana sürece sadece küçük metrik sözlüğünü döndürür
+    metrics = write_run(policy, _TABLE, input_path, filename, compression=compression, output_format=output_format)
+    return policy.title(), filename, metrics
+
+
+def build_tasks(input_path, names, quanta, compression=None, output_format='text'):
+    tasks = []
+    for name in names:
+        if name == RoundRobin.name:
+            for q in quanta:
+                policy = RoundRobin(quantum=q)
+                # Birden çok quantum: dosya adları çakışmasın diye quantum eklenir
+                tag = f"_q{q}" if len(quanta) > 1 else ''
+                tasks.append((policy, output_filename(policy, input_path, tag, compression, output_format)))
+        else:
+            policy = POLICIES[name]()
+            tasks.append((policy, output_filename(policy, input_path, compression=compression,
+                                                 output_format=output_format)))
+    return tasks
+
+
+def shared_table():
+    # İşçi süreçte (veya seri çalışmada) paylaşılan süreç tablosu
+    return _TABLE
+
+
+def process_pool(table, workers, task_count):
+    """Süreç tablosunu işçilerle paylaşan bir ProcessPoolExecutor döndürür."""
+    global _TABLE
+    workers = min(workers or os.cpu_count() or 1, task_count)
+    if 'fork' in multiprocessing.get_all_start_methods():
+        # Çatallanan işçiler tabloyu ebeveynin belleğinden (copy-on-write) okur
+        _TABLE = table
+        return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork'))
+    return ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(table,))
+
+
+def run_all(table, input_path, tasks, workers=None, compression=None, output_format='text'):
+    """Görevleri paralel çalıştırır; görev sırasıyla (başlık, dosya, metrikler) listesi döndürür."""
+    global _TABLE
+    if workers == 1 or len(tasks) == 1:
+        _TABLE = table
+        return [_run_task(policy, input_path, filename, compression, output_format) for policy, filename in tasks]
+
+    with process_pool(table, workers, len(tasks)) as executor:
+        futures = [executor.submit(_run_task, policy, input_path, filename, compression, output_format)
+                   for policy, filename in tasks]
+        return [f.result() for f in futures]
+
+
+def comparison_lines(base_name, rows, heading="Algoritma Karşılaştırması"):
+    # Yan yana metrik tablosu
+    headers = ["Algoritma", "Ort. Bekleme", "Maks. Bekleme", "Ort. Tamamlanma", "Maks. Tamamlanma"]
+    headers += [f"T={t}" for t in CHECK_POINTS]
+    headers += ["CPU Verimliliği", "Bağlam Değiştirme"]
+
+    table_rows = []
+    for title, _, m in rows:
+        row = [title, f"{m['avg_wait']:.4f}", f"{m['max_wait']:.4f}",
+               f"{m['avg_turnaround']:.4f}", f"{m['max_turnaround']:.4f}"]
+        row += [str(m['throughput'][t]) for t in CHECK_POINTS]
+        row += [f"{m['cpu_efficiency']:.4%}", str(m['context_switches'])]
+        table_rows.append(row)
+
+    widths = [max(len(r[c]) for r in [headers] + table_rows) for c in range(len(headers))]
+
+    def fmt(row):
+        # İlk sütun sola, sayılar sağa hizalı
+        cells = [row[0].ljust(widths[0])] + [cell.rjust(w) for cell, w in zip(row[1:], widths[1:])]
+        return " | ".join(cells)
+
+    lines = [f"{heading} - {base_name}", "-" * 40, fmt(headers)]
+    lines.append("-+-".join("-" * w for w in widths))
+    lines.extend(fmt(r) for r in table_rows)
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tüm Çizelgeleme Algoritmalarını Karşılaştır")
+    parser.add_argument('input_file', type=str, help='İşlenecek CSV dosyasının yolu')
+    parser.add_argument('--algorithms', nargs='+', choices=list(POLICIES), default=list(POLICIES),
+                        help='Çalıştırılacak algoritmalar (Varsayılan: hepsi)')
+    parser.add_argument('--quanta', nargs='+', type=int, default=[10],
+                        help='Round Robin için denenecek quantum değerleri (Varsayılan: 10)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Paralel işçi sayısı (Varsayılan: CPU sayısı, 1 = seri)')
+    parser.add_argument('--compress', choices=list(COMPRESSION_SUFFIXES), default=None,
+                        help='Algoritma sonuç dosyalarını sıkıştırarak yaz')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='text',
+                        help='Algoritma sonuç dosyalarının biçimi (Varsayılan: text)')
+    add_cache_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.format == 'binary' and args.compress:
+        parser.error("--format binary, --compress ile birlikte kullanılamaz")
+
+    input_path = args.input_file
+    base_name = os.path.basename(input_path)
+    raw_name = os.path.splitext(base_name)[0]
+
+    try:
+        tasks = build_tasks(input_path, args.algorithms, args.quanta, args.compress, args.format)
+
+        # Önbellekte metrikleriyle birlikte bulunan koşular simüle edilmez
+        cache = cache_from_args(args)
+        rows = [None] * len(tasks)
+        keys = {}
+        for k, (policy, filename) in enumerate(tasks):
+            if cache is not None:
+                keys[k] = run_cache_key(cache, policy, input_path, output_format=args.format, compression=args.compress)
+                metrics = cache.get(keys[k], {'result': filename})
+                if metrics:
+                    rows[k] = (policy.title(), filename, metrics)
+        todo = [k for k, row in enumerate(rows) if row is None]
+
+        if todo:
+            # CSV tek bir kez okunur; öncelik sütunu gerekiyorsa burada kontrol edilir
+            require_priority = any(tasks[k][0].needs_priority for k in todo)
+            table = load_processes(input_path, require_priority=require_priority,
+                                   trace_cache=trace_cache_from_args(args))
+            results = run_all(table, input_path, [tasks[k] for k in todo], args.workers, args.compress, args.format)
+            for k, row in zip(todo, results):
+                rows[k] = row
+                if cache is not None:
+                    cache.put(keys[k], {'result': row[1]}, row[2])
+
+        lines = comparison_lines(base_name, rows)
+        summary_filename = f"karsilastirma_{raw_name}.txt"
+        write_report(summary_filename, lines)
+
+        print("\n".join(lines))
+        print()
+        for _, filename, _ in rows:
+            print(f"Sonuçlar '{filename}' dosyasına yazıldı.")
+        print(f"İşlem Tamamlandı. Karşılaştırma tablosu '{summary_filename}' dosyasına yazıldı.")
+
+    except Exception as e:
+        print(f"Hata oluştu: {e}")
@@ -0,0 +1,167 @@
+# Ayrık olay (discrete-event) simülasyon çekirdeği.
+# Tüm algoritmalar aynı döngüyü kullanır; farkları sadece politika (policy) nesnesindedir:
+#   - on_arrival: gelen işlemi hazır kümesine ekler
+#   - select: hazır kümesinden sıradaki işlemi seçer (ve çıkarır)
+#   - time_slice: seçilen işlemin bu dağıtımdaki en uzun çalışma süresi (quantum)
+#   - on_quantum_expiry: süresi dolan işlemi geri ekler (Round Robin, MLFQ)
+#   - should_preempt / on_preempt: kesmeli politikalarda olay anındaki kontrol
+# Saat, kalan süreler ve olay zamanları tamsayı tick'tir (bkz. ticks.py); sonuçlar
+# birime sadece result() içinde çevrilir.
+
+from .ticks import to_ticks, to_units, units_list
+from .timeline import Timeline
+
+CONTEXT_SWITCH = 0.001
+
+# Simülasyon sonuçlarını değiştiren her değişiklikte artırılır (sonuç önbelleği anahtarının parçası)
+ENGINE_VERSION = 2
+
+
+class SimulationResult:
+    """Bir simülasyon koşusunun ham sonuçları."""
+
+    def __init__(self, table, timeline, completion, first_start, end_time):
+        self.table = table
+        self.timeline = timeline
+        self.completion = completion
+        self.first_start = first_start  # İlk CPU'ya alınma anı (yanıt süresi için)
+        self.end_time = end_time
+
+
+class Simulator:
+    """Tek CPU'lu ayrık olay simülasyonu; seçim kararları politikaya bırakılır."""
+
+    def __init__(self, table, policy, context_switch=CONTEXT_SWITCH, timeline=None):
+        self.table = table
+        self.policy = policy
+        self.context_switch = to_ticks(context_switch)
+
+        self.time = 0
+        self.last = None  # CPU'da en son çalışan işlemin indeksi (IDLE sonrası None)
+        # Varsayılan zaman tablosu bellekte tutulur; yazıcıya akıtmak için StreamingTimeline verilebilir
+        self.timeline = timeline if timeline is not None else Timeline()
+        self._init_state()
+
+    def _init_state(self):
+        # İşlem başına değişen durum; akış (streaming) modunda alt sınıf sözlük kullanır
+        n = len(self.table)
+        self.arrival, burst = self.table.ticks()
+        self.remaining = list(burst)
+        self.completion = [0] * n
+        self.first_start = [-1] * n
+
+        # Henüz hazır kümesine alınmamış ilk işlemin table.order içindeki konumu.
+        # Sadece ileri gider; her işlem tam bir kez kuyruğa girer.
+        self.next_arrival_pos = 0
+
+    def next_arrival_time(self):
+        if self.next_arrival_pos < len(self.table):
+            return self.arrival[self.table.order[self.next_arrival_pos]]
+        return None
+
+    def admit_arrivals(self, t):
+        # t anına kadar gelmiş işlemleri politikaya bildir, ardından politikanın
+        # kendi zamanlı olaylarını (ör. yaşlandırma) işlet
+        order, arrival, n = self.table.order, self.arrival, len(self.table)
+        pos = self.next_arrival_pos
+        while pos < n and arrival[order[pos]] <= t:
+            self.policy.on_arrival(order[pos], t)
+            pos += 1
+        self.next_arrival_pos = pos
+        self.policy.on_time(t)
+
+    def on_complete(self, i):
+        self.completion[i] = self.time
+        self.policy.on_complete(i)
+
+    def result(self):
+        return SimulationResult(self.table, self.timeline, units_list(self.completion),
+                                units_list(self.first_start), to_units(self.time))
+
+    def next_event_time(self):
+        # Kesmeli politikalar için bir sonraki varış veya politika olayı
+        t = self.next_arrival_time()
+        policy_t = self.policy.next_event_time()
+        if policy_t is not None and (t is None or policy_t < t):
+            t = policy_t
+        return t
+
+    def run(self):
+        policy, remaining = self.policy, self.remaining
+        policy.bind(self)
+
+        while True:
+            self.admit_arrivals(self.time)
+
+            if not policy:
+                # IDLE durumu: doğrudan bir sonraki varış anına atla
+                next_arrival = self.next_arrival_time()
+                if next_arrival is None:
+                    break # Hepsi bitti
+                if next_arrival > self.time:
+                    self.timeline.add_idle(self.time, next_arrival)
+                    self.time = next_arrival
+                    self.last = None # IDLE sonrası CS gerekir
+                continue
+
+            # Politika birden çok tam turu tek adımda işleyebilir (RR hızlı ilerletme)
+            if policy.fast_forward(self):
+                continue
+
+            i = policy.select(self.time)
+
+            # Bağlam Değiştirme (Eğer CPU'daki işlem değiştiyse)
+            if self.last != i:
+                self.time += self.context_switch
+                self.last = i
+            if self.first_start[i] < 0:
+                self.first_start[i] = self.time
+
+            # Bağlam değiştirme sırasında gelenler de kuyruğa alınır,
+            # kesme kontrolleri bir sonraki olayda yapılır.
+            self.admit_arrivals(self.time)
+
+            while True:
+                # Ne kadar çalışacak? (Kalan süre, quantum veya bir sonraki olay)
+                run_time = remaining[i]
+                quantum_expired = False
+                quantum = policy.time_slice(i)
+                if quantum is not None and quantum < run_time:
+                    run_time = quantum
+                    quantum_expired = True
+                if policy.preemptive:
+                    event_time = self.next_event_time()
+                    if event_time is not None and event_time - self.time < run_time:
+                        run_time = event_time - self.time
+                        quantum_expired = False
+
+                start_exec = self.time
+                end_exec = start_exec + run_time
+                self.timeline.add(start_exec, i, end_exec)
+
+                remaining[i] -= run_time
+                self.time = end_exec
+
+                # İşlem Bitti mi?
+                if remaining[i] == 0:
+                    self.on_complete(i)
+                    break
+
+                # -- KRİTİK NOKTA --
+                # İşlem çalışırken yeni işlemler gelmiş olabilir.
+                # İşlemi kuyruğa geri atmadan önce YENİ GELENLERİ kuyruğa almalıyız.
+                self.admit_arrivals(self.time)
+
+                if quantum_expired:
+                    policy.on_quantum_expiry(i, self.time)
+                    break
+                if policy.preemptive and policy.should_preempt(i):
+                    policy.on_preempt(i, self.time)
+                    break
+
+        return self.result()
+
+
+def simulate(table, policy, context_switch=CONTEXT_SWITCH, timeline=None):
+    """Verilen politikayla tabloyu simüle eder ve SimulationResult döndürür."""
+    return Simulator(table, policy, context_switch, timeline).run()
@@ -0,0 +1,83 @@
+class IndexedHeap:
+    # Adreslenebilir ikili min-heap.
+    # Her elemanın heap içindeki konumu 'pos' tablosunda tutulur; böylece bir elemanın
+    # anahtarı (öncelik) yeniden tarama yapmadan O(log n) sürede güncellenebilir.
+
+    def __init__(self):
+        self.heap = []  # [(anahtar, eleman)]
+        self.pos = {}   # eleman -> heap içindeki indeks
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return item in self.pos
+
+    def push(self, item, key):
+        self.heap.append((key, item))
+        self.pos[item] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+
+    def peek(self):
+        return self.heap[0][1], self.heap[0][0]
+
+    def pop(self):
+        key, item = self.heap[0]
+        self._remove_at(0)
+        return item, key
+
+    def remove(self, item):
+        self._remove_at(self.pos[item])
+
+    def update(self, item, key):
+        # decrease-key / increase-key: anahtarı değiştir ve doğru yöne kaydır
+        i = self.pos[item]
+        old_key = self.heap[i][0]
+        self.heap[i] = (key, item)
+        if key < old_key:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def _remove_at(self, i):
+        del self.pos[self.heap[i][1]]
+        last = self.heap.pop()
+        if i < len(self.heap):
+            # Boşalan yere son elemanı koy ve konumunu düzelt
+            self.heap[i] = last
+            self.pos[last[1]] = i
+            self._sift_up(i)
+            self._sift_down(self.pos[last[1]])
+
+    def _sift_up(self, i):
+        heap, pos = self.heap, self.pos
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if entry[0] < heap[parent][0]:
+                heap[i] = heap[parent]
+                pos[heap[i][1]] = i
+                i = parent
+            else:
+                break
+        heap[i] = entry
+        pos[entry[1]] = i
+
+    def _sift_down(self, i):
+        heap, pos = self.heap, self.pos
+        size = len(heap)
+        entry = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1][0] < heap[child][0]:
+                child += 1
+            if heap[child][0] < entry[0]:
+                heap[i] = heap[child]
+                pos[heap[i][1]] = i
+                i = child
+            else:
+                break
+        heap[i] = entry
+        pos[entry[1]] = i
@@ -0,0 +1,159 @@
+# CSV yükleyici.
+# Sadece standart kütüphanedeki csv modülünü kullanır; pandas içe aktarılmadığı için
+# betiklerin açılış süresi simülasyonun kendisinden kısa kalır.
+
+import csv
+
+from .process_table import ProcessTable
+
+
+def map_priority(val):
+    # Öncelik Dönüştürme Fonksiyonu (High=1, Normal=2, Low=3)
+    s = str(val).lower().strip()
+    if s == 'high': return 1
+    if s == 'normal': return 2
+    if s == 'low': return 3
+    # Eğer sayısal verilmişse olduğu gibi al
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return 999 # Bilinmeyen değer en düşük öncelik olsun
+
+
+def find_burst_column(columns):
+    # Sütun eşleştirme: 'CPU_Burst_Time' yoksa 'Burst_Time' kabul edilir
+    if 'CPU_Burst_Time' in columns:
+        return 'CPU_Burst_Time'
+    if 'Burst_Time' in columns:
+        return 'Burst_Time'
+    raise KeyError("Sütun hatası: 'CPU_Burst_Time' veya 'Burst_Time' bulunamadı.")
+
+
+def _column_positions(header, require_priority):
+    # Başlığı doğrula ve gerekli sütunların konumlarını döndür
+    burst_col = find_burst_column(header)
+    if 'Arrival_Time' not in header:
+        raise KeyError("Sütun hatası: 'Arrival_Time' bulunamadı.")
+    if require_priority and 'Priority' not in header:
+        raise KeyError("Sütun hatası: 'Priority' bulunamadı.")
+    if 'Process_ID' not in header:
+        raise KeyError("Sütun hatası: 'Process_ID' bulunamadı.")
+
+    priority_pos = header.index('Priority') if 'Priority' in header else None
+    return (header.index('Process_ID'), header.index('Arrival_Time'),
+            header.index(burst_col), priority_pos, burst_col)
+
+
+def iter_rows(path, require_priority=False):
+    """Dosyayı satır satır okur; (sütun adları, satır üreteci) döndürür.
+
+    Üretilen her satır ham metin olarak (id, arrival, burst, priority) demetidir;
+    öncelik sütunu yoksa priority None olur.
+    """
+    # utf-8-sig: Excel'in eklediği BOM başlığa karışmasın
+    f = open(path, newline='', encoding='utf-8-sig')
+    reader = csv.reader(f)
+    header = [h.strip() for h in next(reader, [])]
+    try:
+        id_pos, arrival_pos, burst_pos, priority_pos, burst_col = _column_positions(header, require_priority)
+    except KeyError:
+        f.close()
+        raise
+
+    def rows():
+        with f:
+            for row in reader:
+                if not row:
+                    continue # Boş satırları atla
+                priority = row[priority_pos] if priority_pos is not None else None
+                yield row[id_pos], row[arrival_pos], row[burst_pos], priority
+
+    return {'burst_col': burst_col, 'has_priority': priority_pos is not None}, rows()
+
+
+def read_columns(path, require_priority=False):
+    """Başlığı doğrular ve ham (metin) sütunları döndürür: ids, arrival, burst, priority."""
+    info, rows = iter_rows(path, require_priority)
+    ids, arrival, burst = [], [], []
+    priority = [] if info['has_priority'] else None
+    for p_id, a, b, prio in rows:
+        ids.append(p_id)
+        arrival.append(a)
+        burst.append(b)
+        if priority is not None:
+            priority.append(prio)
+
+    return {'ids': ids, 'arrival': arrival, 'burst': burst, 'priority': priority, 'burst_col': info['burst_col']}
+
+
+def bad_value_error(values, column):
+    # Dönüştürülemeyen ilk değeri bulup okunur bir hata üret
+    for k, value in enumerate(values):
+        try:
+            float(value)
+        except ValueError:
+            return ValueError(f"{k + 1}. veri satırı: '{column}' sütununda geçersiz değer: {value!r}")
+    return ValueError(f"'{column}' sütununda geçersiz değer")
+
+
+def _parse_column(values, column):
+    try:
+        return [float(v) for v in values]
+    except ValueError:
+        raise bad_value_error(values, column) from None
+
+
+def _trace_directory(trace_cache):
+    # trace_cache: True = varsayılan önbellek dizini, metin = verilen dizin
+    return trace_cache if isinstance(trace_cache, str) else None
+
+
+def open_trace_cache(path, require_priority=False, trace_cache=True):
+    # Geçerli bir ayrıştırılmış iz (sidecar) varsa açık Sidecar, yoksa None döndürür
+    from .sidecar import open_sidecar
+    sidecar = open_sidecar(path, _trace_directory(trace_cache))
+    if sidecar is not None and require_priority and not sidecar.has_priority:
+        sidecar.close()
+        raise KeyError("Sütun hatası: 'Priority' bulunamadı.")
+    return sidecar
+
+
+def trace_signature(path):
+    # CSV'nin boyut/zaman/özet imzası; ayrıştırmadan önce alınıp save_trace_cache'e verilir
+    from .sidecar import csv_signature
+    return csv_signature(path)
+
+
+def save_trace_cache(path, table, trace_cache=True, signature=None):
+    from .sidecar import write_sidecar
+    return write_sidecar(path, table, _trace_directory(trace_cache), signature)
+
+
+def load_processes(path, require_priority=False, trace_cache=True):
+    """CSV dosyasını okuyup bir ProcessTable döndürür.
+
+    trace_cache açıkken ilk okumada önbellek dizinine ikili bir sidecar yazılır (metin verilirse
+    o dizine); CSV değişmediği sürece sonraki yüklemeler ayrıştırma yapmadan bu dosyadan
+    okunur (bkz. sidecar.py).
+    """
+    if trace_cache:
+        sidecar = open_trace_cache(path, require_priority, trace_cache)
+        if sidecar is not None:
+            try:
+                return sidecar.to_process_table()
+            finally:
+                sidecar.close()
+        signature = trace_signature(path)
+
+    columns = read_columns(path, require_priority)
+    priority = None
+    if columns['priority'] is not None:
+        priority = [map_priority(v) for v in columns['priority']]
+
+    table = ProcessTable(columns['ids'],
+                         _parse_column(columns['arrival'], 'Arrival_Time'),
+                         _parse_column(columns['burst'], columns['burst_col']),
+                         priority)
+    if trace_cache and signature is not None:
+        save_trace_cache(path, table, trace_cache, signature)
+    return table
@@ -0,0 +1,275 @@
+# Gecikme dağılımları: bekleme, tamamlanma (turnaround) ve yanıt süresi yüzdelikleri.
+# Yanıt süresi = İlk CPU'ya alınma (first_start) - Varış.
+# İki mod vardır:
+#   - exact: tüm değerler tutulur, yüzdelikler sıralı diziden doğrusal aralıkla hesaplanır
+#   - sketch: logaritmik kovalı histogram; bellek işlem sayısından bağımsızdır, iki histogram
+#     kova sayaçları toplanarak birleştirilebilir ve yüzdelikler en fazla %1 göreli hatalıdır
+# Öncelik sütunu varsa aynı metrikler her öncelik sınıfı için ayrıca hesaplanır.
+# ThroughputCurve, sabit kontrol noktaları yerine istenen çözünürlükte iş tamamlama eğrisi üretir.
+
+import math
+from bisect import bisect_left, bisect_right
+
+PERCENTILES = [50, 95, 99]
+LATENCY_MODES = ['exact', 'sketch']
+KINDS = ['waiting', 'turnaround', 'response']
+
+# Öncelik kodu -> sınıf adı (loader.map_priority'nin tersi)
+PRIORITY_NAMES = {1: 'high', 2: 'normal', 3: 'low'}
+
+ZERO_THRESHOLD = 1e-9 # Bu değerin altı (float gürültüsü dahil) sıfır kovasına düşer
+
+
+def quantile(values, q):
+    # Sıralı listede doğrusal aralıkla q (0-1) yüzdeliği
+    pos = q * (len(values) - 1)
+    lo = int(pos)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+
+class ExactDistribution:
+    """Tüm değerleri tutan kesin dağılım."""
+
+    def __init__(self):
+        self.values = []
+
+    def __len__(self):
+        return len(self.values)
+
+    def add(self, x):
+        self.values.append(x)
+
+    def merge(self, other):
+        self.values.extend(other.values)
+
+    def summary(self):
+        values = sorted(self.values)
+        stats = {'max': values[-1], 'avg': sum(self.values) / len(values)}
+        for p in PERCENTILES:
+            stats[f'p{p}'] = quantile(values, p / 100)
+        return stats
+
+
+class LogHistogram:
+    """Göreli hata sınırlı, birleştirilebilir logaritmik histogram (DDSketch benzeri).
+
+    k. kova (gamma^(k-1), gamma^k] aralığını sayar; temsilci değeri 2*gamma^k/(gamma+1)
+    aralıktaki her değere en fazla relative_accuracy oranında uzaktır.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zero = 0
+        # Sayı, toplam ve uç değerler kesin tutulur
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def __len__(self):
+        return self.count
+
+    def add(self, x):
+        self.count += 1
+        self.sum += x
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+        if x <= ZERO_THRESHOLD:
+            self.zero += 1
+        else:
+            k = math.ceil(math.log(x) / self.log_gamma)
+            self.buckets[k] = self.buckets.get(k, 0) + 1
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("Farklı doğruluktaki histogramlar birleştirilemez.")
+        for k, c in other.buckets.items():
+            self.buckets[k] = self.buckets.get(k, 0) + c
+        self.zero += other.zero
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q):
+        rank = q * (self.count - 1)
+        seen = self.zero
+        value = 0.0
+        if rank >= seen:
+            for k in sorted(self.buckets):
+                seen += self.buckets[k]
+                if rank < seen:
+                    value = 2 * self.gamma ** k / (self.gamma + 1)
+                    break
+        # Temsilci değer gerçek uç değerlerin dışına taşmasın
+        return min(max(value, self.min), self.max)
+
+    def summary(self):
+        stats = {'max': self.max, 'avg': self.sum / self.count}
+        for p in PERCENTILES:
+            stats[f'p{p}'] = self.quantile(p / 100)
+        return stats
+
+
+def priority_name(code):
+    return PRIORITY_NAMES.get(code, f"{code:g}")
+
+
+class LatencyCollector:
+    """Biten işlemlerin gecikmelerini toplar; genel ve öncelik sınıfı bazında özetler."""
+
+    def __init__(self, mode='exact'):
+        if mode not in LATENCY_MODES:
+            raise ValueError(f"Bilinmeyen yüzdelik modu: {mode}")
+        self.mode = mode
+        self.overall = self._group()
+        self.classes = {} # öncelik kodu -> grup
+
+    def _group(self):
+        make = ExactDistribution if self.mode == 'exact' else LogHistogram
+        return {kind: make() for kind in KINDS}
+
+    def add(self, arrival, burst, completion, first_start, priority=None):
+        # Turnaround = Completion - Arrival, Waiting = Turnaround - Burst,
+        # Response = First Start - Arrival
+        turnaround = completion - arrival
+        values = (turnaround - burst, turnaround, first_start - arrival)
+        groups = [self.overall]
+        if priority is not None:
+            group = self.classes.get(priority)
+            if group is None:
+                group = self.classes[priority] = self._group()
+            groups.append(group)
+        for group in groups:
+            for kind, value in zip(KINDS, values):
+                group[kind].add(value)
+
+    def merge(self, other):
+        # Aynı moddaki iki toplayıcıyı birleştirir (ör. paralel parçaların sonuçları)
+        for kind in KINDS:
+            self.overall[kind].merge(other.overall[kind])
+        for code, group in other.classes.items():
+            mine = self.classes.get(code)
+            if mine is None:
+                mine = self.classes[code] = self._group()
+            for kind in KINDS:
+                mine[kind].merge(group[kind])
+
+    def as_dict(self):
+        by_priority = None
+        if self.classes:
+            by_priority = {}
+            for code in sorted(self.classes):
+                group = self.classes[code]
+                stats = {kind: group[kind].summary() for kind in KINDS}
+                stats['count'] = len(group['waiting'])
+                by_priority[priority_name(code)] = stats
+
+        latency = {'mode': self.mode}
+        latency.update((kind, self.overall[kind].summary()) for kind in KINDS)
+        latency['by_priority'] = by_priority
+        return latency
+
+
+def latency_metrics(result, mode='exact'):
+    """Bellekteki bir simülasyon sonucu için gecikme yüzdeliklerini hesaplar."""
+    table = result.table
+    collector = LatencyCollector(mode)
+    priority = table.priority if table.has_priority else [None] * len(table)
+    for i in range(len(table)):
+        collector.add(table.arrival[i], table.burst[i], result.completion[i], result.first_start[i], priority[i])
+    return collector.as_dict()
+
+
+class ThroughputCurve:
+    """Verilen noktalarda (ve/veya her 'step' biriminde) T anına kadar biten iş sayısı.
+
+    Bellekteki sonuçlar için tamamlanma zamanları bir kez sıralanır ve her nokta ikili
+    aramayla bulunur: O(n log n + k log n). Akış modunda tamamlanmalar add() ile tek tek
+    eklenir ve sadece nokta/adım başına sayaç tutulur.
+    """
+
+    def __init__(self, points=None, step=None):
+        if step is not None and step <= 0:
+            raise ValueError("Throughput adımı pozitif olmalıdır.")
+        self.points = sorted(set(points or []))
+        self.step = step
+        # Akış modu sayaçları: nokta j'ye ilk dahil olan tamamlanmalar / k. adım kovası
+        self.point_counts = [0] * (len(self.points) + 1)
+        self.step_counts = {}
+
+    def _steps(self, end_time):
+        # 0, step, 2*step, ... ; son nokta end_time'ı kapsar
+        n = math.ceil(end_time / self.step)
+        while n * self.step < end_time:
+            n += 1
+        return n + 1
+
+    def grid(self, end_time):
+        points = set(self.points)
+        if self.step:
+            points.update(k * self.step for k in range(self._steps(end_time)))
+        return sorted(points)
+
+    def evaluate(self, completion, end_time):
+        """Tüm tamamlanma zamanlarından (T, biten iş sayısı) serisini döndürür."""
+        done = sorted(completion)
+        return [(t, bisect_right(done, t)) for t in self.grid(end_time)]
+
+    def add(self, completion):
+        self.point_counts[bisect_left(self.points, completion)] += 1
+        if self.step:
+            # completion <= k*step olan en küçük k
+            k = max(0, math.ceil(completion / self.step))
+            while k * self.step < completion:
+                k += 1
+            while k > 0 and (k - 1) * self.step >= completion:
+                k -= 1
+            self.step_counts[k] = self.step_counts.get(k, 0) + 1
+
+    def series(self, end_time):
+        """add() ile biriktirilen sayaçlardan evaluate ile aynı seriyi üretir."""
+        counts = {}
+        done = 0
+        for t, c in zip(self.points, self.point_counts):
+            done += c
+            counts[t] = done
+        if self.step:
+            done = 0
+            for k in range(self._steps(end_time)):
+                done += self.step_counts.get(k, 0)
+                counts[k * self.step] = done
+        return sorted(counts.items())
+
+
+def percentile_lines(stats):
+    return [f"   P{p}: {stats[f'p{p}']:.4f}" for p in PERCENTILES]
+
+
+def latency_lines(latency):
+    # f) bölümünden sonra eklenen yanıt süresi ve öncelik sınıfı bölümleri
+    lines = [""]
+    lines.append("g) Maksimum, Ortalama ve Yüzdelik Yanıt Süresi [Response Time]")
+    lines.append(f"   Maksimum: {latency['response']['max']:.4f}")
+    lines.append(f"   Ortalama: {latency['response']['avg']:.4f}")
+    lines.extend(percentile_lines(latency['response']))
+
+    if latency['by_priority']:
+        lines.append("")
+        lines.append("h) Öncelik Sınıflarına Göre Ortalama ve Yüzdelik Süreler")
+        labels = {'waiting': 'Bekleme', 'turnaround': 'Tamamlanma', 'response': 'Yanıt'}
+        for name, stats in latency['by_priority'].items():
+            lines.append(f"   {name} ({stats['count']} işlem)")
+            for kind in KINDS:
+                s = stats[kind]
+                values = ", ".join(f"P{p}={s[f'p{p}']:.4f}" for p in PERCENTILES)
+                lines.append(f"      {labels[kind]}: Ortalama={s['avg']:.4f}, {values}")
+
+    if latency['mode'] == 'sketch':
+        lines.append("")
+        lines.append("   Not: Yüzdelikler histogram taslağıyla hesaplanmıştır (göreli hata en fazla %1).")
+    return lines
@@ -0,0 +1,686 @@
+# Çizelgeleme politikaları.
+# Her politika hazır kümesini kendi veri yapısında tutar ve simülasyon çekirdeğine
+# (engine.Simulator) sadece hangi işlemin çalışacağını söyler.
+# Parametreler (quantum, aging, ...) birim cinsinden verilir ve bind'da simülasyonun
+# tamsayı tick tabanına çevrilir; politikaya gelen tüm zamanlar tick'tir.
+
+import heapq
+from collections import deque
+
+from .heaps import IndexedHeap
+from .ticks import to_ticks
+
+
+class Policy:
+    """Politika arayüzü; varsayılanlar kesmesiz ve quantum'suz davranıştır."""
+
+    name = None           # Kısa ad (ör. 'fcfs'); karşılaştırma ve kayıt tablosu için
+    output_prefix = None  # Çıktı dosyası öneki: sonuc_<önek>_<dosya>.txt
+    description = None    # Komut satırı açıklaması
+    needs_priority = False
+    preemptive = False
+    quantum = None
+
+    def bind(self, sim):
+        # Simülasyon başlarken çağrılır; tabloya ve kalan sürelere erişim sağlar.
+        # Hazır kümesi burada kurulduğu için aynı politika nesnesi tekrar kullanılabilir.
+        self.sim = sim
+        self.table = sim.table
+        self.remaining = sim.remaining
+        self.slice = to_ticks(self.quantum) if self.quantum is not None else None
+
+    def title(self):
+        raise NotImplementedError
+
+    def params(self):
+        # Sonucu etkileyen parametreler (kayıt başlığı ve karşılaştırma için)
+        return {}
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def on_arrival(self, i, t):
+        raise NotImplementedError
+
+    def select(self, t):
+        raise NotImplementedError
+
+    def time_slice(self, i):
+        # İşlemin bu dağıtımda kesintisiz çalışabileceği en uzun süre, tick (None = sınırsız).
+        # Kesilen dilimden sonra tekrar sorulur; seviye başına quantum'lu politikalar ezer.
+        return self.slice
+
+    def on_quantum_expiry(self, i, t):
+        raise NotImplementedError
+
+    def should_preempt(self, i):
+        return False
+
+    def running_key(self, i):
+        # Çalışan işlemin hazır kümesindeki sıralama anahtarı (kesmeli politikalar).
+        # Çok çekirdekli modda kesilecek en kötü işlemi seçmek için kullanılır.
+        raise NotImplementedError
+
+    def running_order(self, i, start):
+        # Çalışan işlemler arasında running_key ile aynı sırayı veren ama dilim boyunca
+        # değişmeyen anahtar (start: dilimin başladığı an, tick). Çok çekirdekli modda
+        # çalışan çekirdekler bu anahtarla bir heap'te tutulur.
+        return self.running_key(i)
+
+    def on_preempt(self, i, t):
+        raise NotImplementedError
+
+    def on_complete(self, i):
+        pass
+
+    def on_migrate(self, i):
+        # select ile alınan işlem başka bir çekirdeğin kuyruğuna taşınıyor (iş çalma);
+        # işlem başına tutulan kayıtlar bu kuyruktan bırakılır
+        self.on_complete(i)
+
+    def on_migrate_in(self, i, t):
+        # Başka bir çekirdekten taşınan işlem bu kuyruğa t anında girer;
+        # varsayılan olarak yeni bir varış gibi ele alınır
+        self.on_arrival(i, t)
+
+    def on_time(self, t):
+        # Politikanın kendi zamanlı olayları (ör. yaşlandırma)
+        pass
+
+    def next_event_time(self):
+        return None
+
+    def fast_forward(self, sim):
+        return False
+
+    # -- Komut satırı --
+    @classmethod
+    def add_arguments(cls, parser):
+        pass
+
+    @classmethod
+    def from_args(cls, args):
+        return cls()
+
+
+class FCFS(Policy):
+    name = 'fcfs'
+    output_prefix = 'fcfs'
+    description = "FCFS Çizelgeleme Algoritması"
+
+    def __init__(self, vectorized=False):
+        self.vectorized = vectorized
+
+    def bind(self, sim):
+        super().bind(sim)
+        self.queue = deque()
+
+    def title(self):
+        return "FCFS"
+
+    def __len__(self):
+        return len(self.queue)
+
+    def on_arrival(self, i, t):
+        # Varışlar sıralı geldiği için kuyruk zaten varış sırasındadır
+        self.queue.append(i)
+
+    def select(self, t):
+        return self.queue.popleft()
+
+    def fast_forward(self, sim):
+        # FCFS çizelgesi basit bir yinelemedir: start_i = max(arrival_i, end_{i-1}) + CS.
+        # Vektörel modda kalan tüm işlemler NumPy kümülatif işlemleriyle tek adımda hesaplanır.
+        if not self.vectorized:
+            return False
+        from .columnar import fcfs_schedule
+        import numpy as np
+
+        table = self.table
+        pending = list(self.queue) + table.order[sim.next_arrival_pos:]
+        arrival = np.asarray(sim.arrival)[pending]
+        burst = np.asarray(self.remaining)[pending]
+        start, end, idle = fcfs_schedule(arrival, burst, sim.context_switch, sim.time)
+
+        timeline, remaining = sim.timeline, self.remaining
+        completion, first_start = sim.completion, sim.first_start
+        previous = sim.time
+        for i, a, s, e, gap in zip(pending, arrival.tolist(), start.tolist(), end.tolist(), idle.tolist()):
+            if gap:
+                timeline.add_idle(previous, a)
+            timeline.add(s, i, e)
+            first_start[i] = s
+            completion[i] = e
+            remaining[i] = 0
+            previous = e
+
+        self.queue.clear()
+        sim.next_arrival_pos = len(table)
+        sim.time = previous
+        sim.last = pending[-1]
+        return True
+
+    @classmethod
+    def add_arguments(cls, parser):
+        parser.add_argument('--vectorized', action='store_true',
+                            help='Çizelgeyi NumPy kümülatif işlemleriyle kapalı formda hesapla (NumPy gerektirir)')
+
+    @classmethod
+    def from_args(cls, args):
+        return cls(vectorized=args.vectorized)
+
+
+class _HeapPolicy(Policy):
+    # (anahtar, varış, indeks) min-heap kullanan kesmesiz politikalar için ortak taban.
+    # Eşitlikte önce varış zamanına, sonra dosya sırasına bakılır.
+
+    def bind(self, sim):
+        super().bind(sim)
+        self.heap = []
+
+    def key(self, i):
+        raise NotImplementedError
+
+    def __len__(self):
+        return len(self.heap)
+
+    def on_arrival(self, i, t):
+        heapq.heappush(self.heap, (self.key(i), self.table.arrival[i], i))
+
+    def select(self, t):
+        return heapq.heappop(self.heap)[2]
+
+
+class SJF(_HeapPolicy):
+    name = 'sjf'
+    output_prefix = 'nonpreemptive_sjf'
+    description = "Non-Preemptive SJF Çizelgeleme Algoritması"
+
+    def title(self):
+        return "Non-Preemptive SJF"
+
+    def key(self, i):
+        return self.table.burst[i]
+
+
+class SRTF(_HeapPolicy):
+    name = 'srtf'
+    output_prefix = 'preemptive_sjf'
+    description = "Preemptive SJF (SRTF) Çizelgeleme Algoritması"
+    preemptive = True
+
+    def title(self):
+        return "Preemptive SJF"
+
+    def key(self, i):
+        return self.remaining[i]
+
+    def running_key(self, i):
+        return (self.remaining[i], self.table.arrival[i], i)
+
+    def running_order(self, i, start):
+        # Çalışan işlemlerin kalan süresi aynı hızla azalır; kalan + başlangıç sabittir
+        return (self.remaining[i] + start, self.table.arrival[i], i)
+
+    def should_preempt(self, i):
+        # Bekleyenler zaten çalışan işlemden uzun olduğundan tepe kontrolü yeterlidir
+        return bool(self.heap) and self.heap[0] < self.running_key(i)
+
+    def on_preempt(self, i, t):
+        self.on_arrival(i, t)
+
+
+class Priority(_HeapPolicy):
+    name = 'priority'
+    output_prefix = 'nonpreemptive_priority'
+    description = "Non-Preemptive Priority Scheduling Algoritması"
+    needs_priority = True
+
+    def title(self):
+        return "Non-Preemptive Priority Scheduling"
+
+    def key(self, i):
+        return self.table.priority[i]
+
+
+class PreemptivePriority(Policy):
+    name = 'preemptive_priority'
+    output_prefix = 'preemptive_priority'
+    description = "Preemptive Priority Scheduling Algoritması"
+    needs_priority = True
+    preemptive = True
+
+    AGING_FLOOR = 1 # Yaşlandırma ile ulaşılabilecek en yüksek öncelik (high)
+
+    def __init__(self, aging=0):
+        # Aging: hazır kümesinde her 'aging' birim bekleyen işlemin önceliği bir kademe artar
+        self.aging = aging
+
+    def bind(self, sim):
+        super().bind(sim)
+        self.aging_ticks = to_ticks(self.aging)
+        # Hazır kümesi: (efektif öncelik, varış, indeks) anahtarlı adreslenebilir heap
+        self.ready = IndexedHeap()
+        # Yaşlandırma olayları: (zaman, indeks, damga) min-heap.
+        # Her kuyruğa girişte yeni (tekil) bir damga verilir; eskimiş olaylar böylece atlanır.
+        self.aging_events = []
+        self.next_stamp = 0
+        # İşlem başına efektif öncelik ve kuyruğa giriş damgası. Sözlük kullanılır ki
+        # akış modunda sadece canlı işlemler için yer tutulsun (on_complete ile silinir).
+        self.effective = {}
+        self.stamp = {}
+
+    def title(self):
+        if self.aging > 0:
+            return f"Preemptive Priority Scheduling (Aging={self.aging:g})"
+        return "Preemptive Priority Scheduling"
+
+    def params(self):
+        return {'aging': self.aging}
+
+    def __len__(self):
+        return len(self.ready)
+
+    def _make_ready(self, i, t):
+        # İşlemi temel önceliğiyle hazır kümesine ekle, yaşlandırma saatini başlat
+        self.effective[i] = self.table.priority[i]
+        # Damga işlem başına değil genel sayaçtır: on_complete/on_migrate ile silinip
+        # tekrar kuyruğa giren işlemin eski olayları yeniden geçerli sayılmaz
+        self.next_stamp += 1
+        self.stamp[i] = self.next_stamp
+        self.ready.push(i, (self.effective[i], self.table.arrival[i], i))
+        if self.aging_ticks > 0 and self.effective[i] > self.AGING_FLOOR:
+            heapq.heappush(self.aging_events, (t + self.aging_ticks, i, self.stamp[i]))
+
+    def on_arrival(self, i, t):
+        self._make_ready(i, self.sim.arrival[i])
+
+    def on_migrate_in(self, i, t):
+        # Yaşlandırma saati taşınma anından başlar; diğer çekirdeğin kuyruğunda
+        # beklenen süre bu kuyrukta yaşlandırma kazandırmaz
+        self._make_ready(i, t)
+
+    def select(self, t):
+        # CPU'ya alınan işlem yaşlandırmayla kazandığı önceliği çalıştığı sürece korur;
+        # temel değere ancak kuyruğa geri döndüğünde (_make_ready) iner. Aksi halde
+        # yaşlanıp dağıtılan işlem, bir sonraki olaya kadar yüksek öncelikli işleri bekletirdi.
+        i, _ = self.ready.pop()
+        return i
+
+    def running_key(self, i):
+        return (self.effective[i], self.table.arrival[i], i)
+
+    def should_preempt(self, i):
+        # Sadece kesin olarak daha yüksek öncelik keser; eşit öncelikte (varış/indeks
+        # eşitlik bozucusu ile) kesme yapılmaz
+        return bool(self.ready) and self.ready.peek()[1][0] < self.effective[i]
+
+    def on_preempt(self, i, t):
+        self._make_ready(i, t)
+
+    def on_complete(self, i):
+        del self.effective[i]
+        del self.stamp[i]
+
+    def on_time(self, t):
+        # Süresi gelen her yaşlandırma adımı tek bir O(log n) anahtar güncellemesidir
+        events = self.aging_events
+        while events and events[0][0] <= t:
+            due, i, stamp = heapq.heappop(events)
+            if not self._live(i, stamp):
+                continue
+            self.effective[i] = max(self.AGING_FLOOR, self.effective[i] - 1)
+            self.ready.update(i, (self.effective[i], self.table.arrival[i], i))
+            if self.effective[i] > self.AGING_FLOOR:
+                heapq.heappush(events, (due + self.aging_ticks, i, stamp))
+
+    def _live(self, i, stamp):
+        # Olay, işlem hâlâ aynı kuyruğa girişiyle hazır kümesindeyse geçerlidir
+        return i in self.ready and self.stamp[i] == stamp
+
+    def next_event_time(self):
+        # Eskimiş olaylar (çalışmaya başlamış, bitmiş veya taşınmış işlemler) baştan atılır;
+        # aksi halde var olmayan bir yaşlandırma anı dilimleri gereksiz yere keserdi
+        events = self.aging_events
+        while events and not self._live(events[0][1], events[0][2]):
+            heapq.heappop(events)
+        return events[0][0] if events else None
+
+    @classmethod
+    def add_arguments(cls, parser):
+        # Varsayılan 0 = kapalı (klasik preemptive priority).
+        parser.add_argument('--aging', type=float, default=0, help='Yaşlandırma aralığı N; her N birim beklemede öncelik 1 artar (Varsayılan: 0, kapalı)')
+
+    @classmethod
+    def from_args(cls, args):
+        return cls(aging=args.aging)
+
+
+class RoundRobin(Policy):
+    name = 'rr'
+    output_prefix = 'roundrobin'
+    description = "Round Robin (RR) Çizelgeleme Algoritması"
+
+    def __init__(self, quantum=10, fast_forward=False):
+        self.quantum = quantum
+        self.fast_forward_enabled = fast_forward
+
+    def bind(self, sim):
+        super().bind(sim)
+        # Hazır Kuyruğu (Ready Queue)
+        self.queue = deque()
+        # Son hızlı ilerletme denemesinden bu yana yapılan dağıtım sayısı.
+        # Deneme O(k) sürdüğü için en fazla k dağıtımda bir yapılır (amortize O(1)).
+        self.dispatches_since_ff = 0
+
+    def title(self):
+        return f"Round Robin (Quantum={self.quantum})"
+
+    def params(self):
+        return {'quantum': self.quantum, 'fast_forward': self.fast_forward_enabled}
+
+    def __len__(self):
+        return len(self.queue)
+
+    def on_arrival(self, i, t):
+        self.queue.append(i)
+
+    def select(self, t):
+        self.dispatches_since_ff += 1
+        return self.queue.popleft()
+
+    def on_quantum_expiry(self, i, t):
+        # Bitmediyse kuyruğun sonuna geri ekle
+        self.queue.append(i)
+
+    def fast_forward(self, sim):
+        # Kuyruktaki k işlemin her biri bir quantum çalışıyorsa (tam tur),
+        # bir sonraki varışa veya ilk tamamlanmaya kadar kaç tur geçebileceğini hesapla
+        # ve kalan süreleri ile saati tek adımda ilerlet.
+        # Tur sonunda kuyruk sırası değişmediği için ardından normal akış devam eder.
+        queue, quantum, remaining = self.queue, self.slice, self.remaining
+        if not self.fast_forward_enabled or self.dispatches_since_ff < len(queue):
+            return False
+        self.dispatches_since_ff = 0
+
+        k = len(queue)
+        if k == 1:
+            # Tek işlem: kendi içinde bağlam değiştirme yok, kararlı durumda zaten CPU'da
+            if queue[0] != sim.last:
+                return False
+            round_length = quantum
+        else:
+            # Turun ilk dağıtımı da bağlam değiştirmeli olmalı (kararlı durum)
+            if queue[0] == sim.last:
+                return False
+            round_length = k * (quantum + sim.context_switch)
+
+        # Hiçbir işlem bitmeden geçebilecek tur sayısı: ceil(kalan / quantum) - 1
+        rounds = min((remaining[i] - 1) // quantum for i in queue)
+
+        # Son dilimin bitişi bir sonraki varıştan kesin önce olmalı
+        # (aksi halde yeni gelen, geri eklenen işlemden önce sıraya girer)
+        next_arrival = sim.next_arrival_time()
+        if next_arrival is not None:
+            rounds = min(rounds, (next_arrival - 1 - sim.time) // round_length)
+
+        if rounds < 1:
+            return False
+
+        start = sim.time
+        first_start = sim.first_start
+        for j, i in enumerate(queue):
+            remaining[i] -= rounds * quantum
+            if first_start[i] < 0:
+                # Henüz hiç çalışmamış üye ilk turdaki diliminde başlar
+                first_start[i] = start + j * (quantum + sim.context_switch) + sim.context_switch
+        sim.time = start + rounds * round_length
+
+        if k == 1:
+            # Tek işlemin ardışık dilimleri zaten birleştirilir
+            sim.timeline.add(start, queue[0], sim.time)
+        else:
+            sim.timeline.add_rounds(start, sim.time, rounds, queue, quantum, sim.context_switch)
+            sim.last = queue[-1]
+        return True
+
+    @classmethod
+    def add_arguments(cls, parser):
+        # Varsayılan Quantum süresini 10 olarak belirledik, isterseniz çalıştırırken değiştirebilirsiniz.
+        parser.add_argument('--quantum', type=int, default=10, help='Zaman Dilimi (Quantum) süresi (Varsayılan: 10)')
+        # Hızlı ilerletme: varış ve tamamlanma olmayan tam turları tek adımda hesaplar.
+        parser.add_argument('--fast-forward', action='store_true', help='Kararlı durumdaki tam turları aritmetik olarak tek adımda ilerlet')
+        parser.add_argument('--timeline', choices=['expanded', 'compressed'], default='expanded',
+                            help="Hızlı ilerletilen turların zaman tablosundaki gösterimi (Varsayılan: expanded)")
+
+    @classmethod
+    def from_args(cls, args):
+        return cls(quantum=args.quantum, fast_forward=args.fast_forward)
+
+
+class MLFQ(Policy):
+    name = 'mlfq'
+    output_prefix = 'mlfq'
+    description = "Çok Seviyeli Geri Beslemeli Kuyruk (MLFQ) Çizelgeleme Algoritması"
+    preemptive = True
+
+    def __init__(self, levels=3, quantum=10, quanta=None, boost=100):
+        # Seviye k'nin quantum'u verilmezse quantum * 2^k (0 = en yüksek öncelik).
+        # boost: her 'boost' birimde tüm işlemler en üst seviyeye taşınır (0 = kapalı)
+        self.quanta = list(quanta) if quanta else [quantum * 2 ** k for k in range(levels)]
+        if not self.quanta or min(self.quanta) <= 0 or boost < 0:
+            raise ValueError("MLFQ seviye sayısı ve quantum değerleri pozitif, boost aralığı negatif olmayan bir sayı olmalıdır.")
+        self.levels = len(self.quanta)
+        self.boost = boost
+
+    def bind(self, sim):
+        super().bind(sim)
+        # Seviye başına Round Robin kuyruğu; bitmap'in k. biti k. kuyruk boş değilse 1'dir,
+        # böylece en yüksek dolu seviye kuyruk uzunluklarından bağımsız O(1) bulunur
+        self.queues = [deque() for _ in range(self.levels)]
+        self.bitmap = 0
+        self.count = 0
+        # İşlem başına seviye ve o seviyedeki hakkın başladığı andaki kalan süre.
+        # Kesilen işlem hakkını korur; hakkını bitiren işlem bir alt seviyeye iner.
+        self.level = {}
+        self.base = {}
+        self.slices = [to_ticks(q) for q in self.quanta]
+        self.boost_ticks = to_ticks(self.boost)
+        self.next_boost = self.boost_ticks if self.boost_ticks > 0 else None
+
+    def title(self):
+        quanta = "/".join(f"{q:g}" for q in self.quanta)
+        if self.boost > 0:
+            return f"MLFQ (Quantum={quanta}, Boost={self.boost:g})"
+        return f"MLFQ (Quantum={quanta})"
+
+    def params(self):
+        return {'quanta': self.quanta, 'boost': self.boost}
+
+    def __len__(self):
+        return self.count
+
+    def _top(self):
+        # En düşük 1 bitinin konumu = en yüksek öncelikli dolu seviye
+        bitmap = self.bitmap
+        return (bitmap & -bitmap).bit_length() - 1
+
+    def _push(self, i, level, front=False):
+        if front:
+            self.queues[level].appendleft(i)
+        else:
+            self.queues[level].append(i)
+        self.bitmap |= 1 << level
+        self.count += 1
+
+    def _enter_level(self, i, level):
+        self.level[i] = level
+        self.base[i] = self.remaining[i]
+
+    def on_arrival(self, i, t):
+        self._enter_level(i, 0)
+        self._push(i, 0)
+
+    def select(self, t):
+        level = self._top()
+        queue = self.queues[level]
+        i = queue.popleft()
+        if not queue:
+            self.bitmap &= ~(1 << level)
+        self.count -= 1
+        return i
+
+    def time_slice(self, i):
+        # Bu seviyedeki hakkın kalanı
+        return self.slices[self.level[i]] - (self.base[i] - self.remaining[i])
+
+    def on_quantum_expiry(self, i, t):
+        # Hakkını bitiren işlem bir alt seviyeye iner (en alt seviyede Round Robin sürer).
+        # Aynı anda öncelik yükseltmesi olduysa hak yenilenmiştir; işlem seviyesinde kalır.
+        level = self.level[i]
+        if self.time_slice(i) == 0:
+            level = min(level + 1, self.levels - 1)
+            self._enter_level(i, level)
+        self._push(i, level)
+
+    def running_key(self, i):
+        return (self.level[i], self.table.arrival[i], i)
+
+    def should_preempt(self, i):
+        return self.bitmap != 0 and self._top() < self.level[i]
+
+    def on_preempt(self, i, t):
+        # Daha yüksek seviyedeki bir işlem tarafından kesildi; sırasını kaybetmez
+        self._push(i, self.level[i], front=True)
+
+    def on_complete(self, i):
+        # Not: çok çekirdekli iş çalmada (on_migrate) taşınan işlem yeni kuyrukta üst seviyeden başlar
+        del self.level[i]
+        del self.base[i]
+
+    def on_time(self, t):
+        if self.next_boost is None or t < self.next_boost:
+            return
+        # Öncelik yükseltme: kuyruklar sıraları korunarak en üst seviyede birleştirilir,
+        # çalışanlar dahil tüm işlemlerin hakkı yenilenir
+        top = self.queues[0]
+        for queue in self.queues[1:]:
+            top.extend(queue)
+            queue.clear()
+        self.bitmap = 1 if top else 0
+        for i in self.level:
+            self._enter_level(i, 0)
+        self.next_boost = (t // self.boost_ticks + 1) * self.boost_ticks
+
+    def next_event_time(self):
+        return self.next_boost
+
+    @classmethod
+    def add_arguments(cls, parser):
+        parser.add_argument('--levels', type=int, default=3, help='Kuyruk seviyesi sayısı (Varsayılan: 3)')
+        parser.add_argument('--quantum', type=int, default=10,
+                            help='En üst seviyenin quantum süresi; her alt seviyede iki katına çıkar (Varsayılan: 10)')
+        parser.add_argument('--quanta', nargs='+', type=int, default=None,
+                            help='Seviye başına quantum değerleri, üstten alta (ör. --quanta 8 16 32); --levels ve --quantum yerine geçer')
+        parser.add_argument('--boost', type=float, default=100,
+                            help='Öncelik yükseltme aralığı S; her S birimde tüm işlemler en üst seviyeye çıkar (Varsayılan: 100, 0 = kapalı)')
+
+    @classmethod
+    def from_args(cls, args):
+        return cls(levels=args.levels, quantum=args.quantum, quanta=args.quanta, boost=args.boost)
+
+
+class CFS(Policy):
+    name = 'cfs'
+    output_prefix = 'cfs'
+    description = "CFS Benzeri Adil Çizelgeleme Algoritması (Completely Fair Scheduler)"
+
+    NICE_0_WEIGHT = 1024
+
+    def __init__(self, latency=6.0, min_granularity=0.75):
+        # latency: tüm hazır işlemlerin bir kez çalışması hedeflenen süre (sched_latency)
+        # min_granularity: bir dağıtımda en az çalışma süresi; çok işlemde dönem n * bu değer olur
+        if latency <= 0 or min_granularity <= 0:
+            raise ValueError("Hedef gecikme ve minimum dilim süresi pozitif olmalıdır.")
+        self.latency = latency
+        self.min_granularity = min_granularity
+
+    def bind(self, sim):
+        super().bind(sim)
+        # Hazır kümesi: (sanal çalışma süresi, varış, indeks) min-heap. Bekleyen işlemlerin
+        # vruntime'ı değişmediği için anahtar güncellemesi (ve tembel silme) gerekmez.
+        self.heap = []
+        self.vruntime = {}
+        self.weights = {}
+        self.start = {}       # CPU'ya alınırken kalan süre (çalışılan süre = fark)
+        self.min_vruntime = 0
+        self.load = 0         # Çalışan ve bekleyen tüm işlemlerin ağırlık toplamı
+        self.nr_running = 0
+        self.latency_ticks = to_ticks(self.latency)
+        self.granularity_ticks = to_ticks(self.min_granularity)
+
+    def title(self):
+        return f"CFS (Hedef Gecikme={self.latency:g}, Min. Dilim={self.min_granularity:g})"
+
+    def params(self):
+        return {'latency': self.latency, 'min_granularity': self.min_granularity}
+
+    def weight(self, i):
+        # Öncelik -> nice değeri (high=-5, normal=0, low=5), nice -> ağırlık Linux'taki gibi
+        # her kademede ~1.25 kat değişir (tamsayı); öncelik sütunu yoksa tüm işlemler eşittir
+        if not self.table.has_priority:
+            return self.NICE_0_WEIGHT
+        nice = min(19, max(-20, 5 * (self.table.priority[i] - 2)))
+        return max(1, round(self.NICE_0_WEIGHT / 1.25 ** nice))
+
+    def __len__(self):
+        return len(self.heap)
+
+    def on_arrival(self, i, t):
+        # Yeni işlem mevcut en küçük vruntime'dan başlar (ne öne geçer ne geride kalır)
+        self.vruntime[i] = self.min_vruntime
+        self.weights[i] = self.weight(i)
+        self.load += self.weights[i]
+        self.nr_running += 1
+        heapq.heappush(self.heap, (self.min_vruntime, self.table.arrival[i], i))
+
+    def select(self, t):
+        v, _, i = heapq.heappop(self.heap)
+        self.min_vruntime = max(self.min_vruntime, v)
+        self.start[i] = self.remaining[i]
+        return i
+
+    def time_slice(self, i):
+        # Dönem = max(hedef gecikme, n * minimum dilim); işlemin payı ağırlığıyla orantılıdır
+        period = max(self.latency_ticks, self.nr_running * self.granularity_ticks)
+        return max(self.granularity_ticks, period * self.weights[i] // self.load)
+
+    def _charge(self, i):
+        # Çalışılan süre ağırlıkla ölçeklenerek vruntime'a eklenir (yüksek öncelik yavaş ilerler)
+        ran = self.start.pop(i) - self.remaining[i]
+        self.vruntime[i] += ran * self.NICE_0_WEIGHT // self.weights[i]
+
+    def on_quantum_expiry(self, i, t):
+        self._charge(i)
+        heapq.heappush(self.heap, (self.vruntime[i], self.table.arrival[i], i))
+
+    def on_complete(self, i):
+        del self.vruntime[i]
+        self.start.pop(i, None)
+        self.load -= self.weights.pop(i)
+        self.nr_running -= 1
+
+    @classmethod
+    def add_arguments(cls, parser):
+        parser.add_argument('--latency', type=float, default=6.0,
+                            help='Hedef gecikme: hazır işlemlerin her birinin bir kez çalışacağı dönem (Varsayılan: 6)')
+        parser.add_argument('--min-granularity', type=float, default=0.75,
+                            help='Bir dağıtımdaki en kısa çalışma süresi; dönem en az n * bu değerdir (Varsayılan: 0.75)')
+
+    @classmethod
+    def from_args(cls, args):
+        return cls(latency=args.latency, min_granularity=args.min_granularity)
+
+
+# Kısa ad -> politika sınıfı
+POLICIES = {cls.name: cls for cls in (FCFS, SJF, SRTF, RoundRobin, Priority, PreemptivePriority, MLFQ, CFS)}
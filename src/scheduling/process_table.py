@@ -0,0 +1,36 @@
+# Süreç tablosu: CSV'den okunan işlemlerin sütun bazlı (columnar) tutulduğu yapı.
+# Simülasyon motoru her işleme indeksiyle erişir; çalışma sırasında değişen
+# değerler (kalan süre, tamamlanma) tabloda değil motorun kendi listelerinde tutulur.
+
+from .ticks import ticks_list
+
+
+class ProcessTable:
+    """Giriş dosyasındaki işlemlerin değişmeyen bilgileri."""
+
+    def __init__(self, ids, arrival, burst, priority=None, order=None, ticks=None):
+        self.ids = list(ids)
+        self.arrival = [float(a) for a in arrival]
+        self.burst = [float(b) for b in burst]
+        # Öncelik sütunu olmayan dosyalarda None kalır (FCFS, SJF, RR için gerekmez)
+        self.priority = list(priority) if priority is not None else None
+
+        # Varış zamanına göre sıralı indeksler (eşitlikte dosya sırası korunur).
+        # Sıralama önceden yapılmışsa (ör. NumPy ile) doğrudan verilebilir.
+        if order is None:
+            order = sorted(range(len(self.ids)), key=self.arrival.__getitem__)
+        self.order = list(order)
+        # (varış, süre) tamsayı tick listeleri; ilk simülasyonda hesaplanıp saklanır
+        self._ticks = ticks
+
+    def ticks(self):
+        if self._ticks is None:
+            self._ticks = (ticks_list(self.arrival), ticks_list(self.burst))
+        return self._ticks
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def has_priority(self):
+        return self.priority is not None
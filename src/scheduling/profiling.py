@@ -0,0 +1,222 @@
+# Koşu profili (--profile).
+# Aşama süreleri (yükleme, simülasyon, metrikler, yazma) ve olay döngüsü sayaçları toplanır.
+# Sayaçlar, simülatörün politika ve zaman tablosu nesneleri sayan vekillerle (proxy)
+# değiştirilerek tutulur; --profile verilmediğinde çekirdek bu vekilleri hiç görmez ve
+# sıcak yola (hot path) hiçbir kontrol eklenmez. 'phases' modu sadece aşama sürelerini
+# ölçer (vekil yok, ek maliyet aşama başına birkaç saat okuması). --profile-dump ile koşunun
+# tamamı ayrıca cProfile ile izlenir ve pstats dosyası yazılır.
+
+import io
+import time
+from contextlib import contextmanager, nullcontext
+
+PROFILE_MODES = ['phases', 'counters']
+PHASES = ['load', 'simulate', 'metrics', 'write']
+PHASE_LABELS = {'load': 'Yükleme', 'simulate': 'Simülasyon', 'metrics': 'Metrikler', 'write': 'Yazma'}
+
+COUNTERS = ['iterations', 'slices', 'merged', 'selections', 'preemptions', 'expiries', 'idle_jumps',
+            'fast_forwards', 'ff_rounds', 'arrivals', 'completions']
+COUNTER_LABELS = {
+    'iterations': 'Olay döngüsü turu',
+    'slices': 'Çalıştırılan dilim',
+    'merged': 'Birleştirilen dilim',
+    'selections': 'Seçim (select)',
+    'preemptions': 'Kesme (preemption)',
+    'expiries': 'Quantum dolması',
+    'idle_jumps': 'IDLE atlaması',
+    'fast_forwards': 'Hızlı ilerletme adımı',
+    'ff_rounds': 'Tur bloklarındaki tur',
+    'arrivals': 'Varış',
+    'completions': 'Tamamlanma',
+}
+
+
+def phase(profiler, name):
+    """Profil açıksa aşama süresini ölçen, değilse boş bir bağlam yöneticisi döndürür."""
+    return nullcontext() if profiler is None else profiler.phase(name)
+
+
+class Profiler:
+    """Aşama süreleri, sayaçlar ve seçim anındaki hazır kümesi boyutu dağılımı."""
+
+    def __init__(self, mode='counters', dump_path=None):
+        self.mode = mode
+        self.times = dict.fromkeys(PHASES, 0.0)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.instrumented = False
+        # Hazır kümesi boyutu: toplam, en büyük ve 2'nin kuvvetlerine göre kovalar
+        self.ready_total = 0
+        self.ready_max = 0
+        self.ready_buckets = {}
+        self.dump_path = dump_path
+        self._cprofile = None
+        self._stack = []
+        self._mark = None
+        self.started = self.stopped = None
+
+    def start(self):
+        if self.dump_path:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self.started = time.perf_counter()
+
+    def stop(self):
+        self.stopped = time.perf_counter()
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.dump_path)
+
+    @contextmanager
+    def phase(self, name):
+        # İç içe aşamalarda süre en içteki aşamaya yazılır; dıştaki aşamada tekrar sayılmaz
+        now = time.perf_counter()
+        if self._stack:
+            self._charge(now)
+        self._stack.append(name)
+        self._mark = now
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self._charge(now)
+            self._stack.pop()
+            self._mark = now
+
+    def _charge(self, now):
+        name = self._stack[-1]
+        self.times[name] = self.times.get(name, 0.0) + now - self._mark
+
+    def instrument(self, sim):
+        """Simülatörün politika ve zaman tablosunu sayan vekillerle değiştirir (run'dan önce)."""
+        if self.mode != 'counters':
+            return sim
+        sim.policy = ProfiledPolicy(sim.policy, self)
+        sim.timeline = ProfiledTimeline(sim.timeline, self)
+        self.instrumented = True
+        return sim
+
+    def record_ready(self, size):
+        self.ready_total += size
+        if size > self.ready_max:
+            self.ready_max = size
+        bucket = size.bit_length() # 0, 1, 2-3, 4-7, ...
+        self.ready_buckets[bucket] = self.ready_buckets.get(bucket, 0) + 1
+
+    def report_lines(self, top=15):
+        total = self.stopped - self.started
+        lines = ["", "Profil", "-" * 40, "Aşama Süreleri"]
+        for name in PHASES:
+            t = self.times[name]
+            share = t / total if total > 0 else 0
+            lines.append(f"   {PHASE_LABELS[name] + ':':<12} {t:10.4f} s ({share:6.1%})")
+        lines.append(f"   {'Toplam:':<12} {total:10.4f} s")
+
+        if self.mode == 'counters' and not self.instrumented:
+            lines.append("")
+            lines.append("Sayaçlar çok çekirdekli modda toplanmaz.")
+        elif self.instrumented:
+            lines.append("")
+            lines.append("Sayaçlar")
+            for name in COUNTERS:
+                lines.append(f"   {COUNTER_LABELS[name] + ':':<24} {self.counters[name]}")
+            selections = self.counters['selections']
+            if selections:
+                lines.append("")
+                lines.append("Seçim Anındaki Hazır Kümesi Boyutu")
+                lines.append(f"   Ortalama: {self.ready_total / selections:.2f}, Maksimum: {self.ready_max}")
+                for bucket in sorted(self.ready_buckets):
+                    low, high = (1 << bucket) >> 1, (1 << bucket) - 1
+                    label = str(low) if low == high else f"{low}-{high}"
+                    lines.append(f"   {label:>15}: {self.ready_buckets[bucket]}")
+
+        if self._cprofile is not None:
+            import pstats
+            out = io.StringIO()
+            pstats.Stats(self._cprofile, stream=out).sort_stats('tottime').print_stats(top)
+            lines.append("")
+            lines.append(f"cProfile (ilk {top}, tottime) - tüm istatistikler '{self.dump_path}' dosyasında:")
+            lines.extend(line for line in out.getvalue().splitlines() if line.strip())
+        return lines
+
+
+class ProfiledPolicy:
+    """Politika çağrılarını sayıp asıl politikaya ileten vekil."""
+
+    def __init__(self, policy, profiler):
+        self._policy = policy
+        self._profiler = profiler
+        self._counters = profiler.counters
+
+    def __getattr__(self, name):
+        # Sayılmayan metotlar ilk erişimde vekile bağlanır; sonraki çağrılar __getattr__'a düşmez
+        value = getattr(self._policy, name)
+        if callable(value):
+            setattr(self, name, value)
+        return value
+
+    def __len__(self):
+        # Çekirdek her olay döngüsü turunda hazır kümesinin boş olup olmadığına bir kez bakar
+        self._counters['iterations'] += 1
+        return len(self._policy)
+
+    def on_arrival(self, i, t):
+        self._counters['arrivals'] += 1
+        self._policy.on_arrival(i, t)
+
+    def select(self, t):
+        self._counters['selections'] += 1
+        self._profiler.record_ready(len(self._policy))
+        return self._policy.select(t)
+
+    def on_quantum_expiry(self, i, t):
+        self._counters['expiries'] += 1
+        self._policy.on_quantum_expiry(i, t)
+
+    def on_preempt(self, i, t):
+        self._counters['preemptions'] += 1
+        self._policy.on_preempt(i, t)
+
+    def on_complete(self, i):
+        self._counters['completions'] += 1
+        self._policy.on_complete(i)
+
+    def fast_forward(self, sim):
+        done = self._policy.fast_forward(sim)
+        if done:
+            self._counters['fast_forwards'] += 1
+        return done
+
+
+class ProfiledTimeline:
+    """Zaman tablosu eklemelerini ve birleştirmelerini sayan vekil."""
+
+    def __init__(self, timeline, profiler):
+        self._timeline = timeline
+        self._counters = profiler.counters
+
+    def __getattr__(self, name):
+        return getattr(self._timeline, name)
+
+    def __iter__(self):
+        return iter(self._timeline)
+
+    def __len__(self):
+        return len(self._timeline)
+
+    def add(self, start, idx, end):
+        # Birleştirmede son kayıt aynı nesne olarak kalır, yeni dilimde yenisi eklenir
+        self._counters['slices'] += 1
+        entries = self._timeline.entries
+        last = entries[-1] if entries else None
+        self._timeline.add(start, idx, end)
+        if last is not None and entries and entries[-1] is last:
+            self._counters['merged'] += 1
+
+    def add_idle(self, start, end):
+        self._counters['idle_jumps'] += 1
+        self._timeline.add_idle(start, end)
+
+    def add_rounds(self, start, end, rounds, members, quantum, context_switch):
+        self._counters['ff_rounds'] += rounds
+        self._timeline.add_rounds(start, end, rounds, members, quantum, context_switch)
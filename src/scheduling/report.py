@@ -0,0 +1,145 @@
+# Metrik hesaplama ve sonuç dosyası (a-f bölümleri) üretimi.
+
+from bisect import bisect_right
+
+from .metrics import latency_lines, percentile_lines
+from .ticks import TICKS_PER_UNIT
+from .timeline import IDLE, ROUND, expand_rounds
+
+CHECK_POINTS = [50, 100, 150, 200]
+
+
+def compute_metrics(result):
+    """Bekleme, tamamlanma, throughput, CPU verimliliği ve bağlam değiştirme metrikleri."""
+    table = result.table
+    n = len(table)
+
+    # Turnaround = Completion - Arrival, Waiting = Turnaround - Burst
+    turnaround = [result.completion[i] - table.arrival[i] for i in range(n)]
+    waiting = [turnaround[i] - table.burst[i] for i in range(n)]
+
+    # Tamamlanma zamanları bir kez sıralanır; her kontrol noktası ikili aramadır
+    completion_sorted = sorted(result.completion)
+    throughput = {t: bisect_right(completion_sorted, t) for t in CHECK_POINTS}
+
+    total_burst = sum(table.burst)
+    end_time = result.end_time
+
+    return {
+        'max_wait': max(waiting),
+        'avg_wait': sum(waiting) / n,
+        'max_turnaround': max(turnaround),
+        'avg_turnaround': sum(turnaround) / n,
+        'throughput': throughput,
+        'cpu_efficiency': total_burst / end_time if end_time > 0 else 0,
+        'context_switches': result.timeline.context_switches(),
+    }
+
+
+def entry_lines(entry, ids, mode='expanded'):
+    # Format: [ Başlangıç ] -- Pxxx -- [ Bitiş ]
+    start, idx, end = entry[0], entry[1], entry[2]
+    if idx == ROUND:
+        if mode == 'compressed':
+            # Tekrarlanan tur bloğu: ilk dilimin başlangıcı -- üyeler -- son dilimin bitişi
+            members = ", ".join(str(ids[i]) for i in entry[4])
+            first = (entry[7] + entry[6]) / TICKS_PER_UNIT
+            yield f"[{first:.4g}] -- ROUND x{entry[3]} ({members}) -- [{end:.4g}]"
+        else:
+            for s, i, e in expand_rounds(entry):
+                yield f"[{s:.4g}] -- {ids[i]} -- [{e:.4g}]"
+    elif idx == IDLE:
+        yield f"[{start:.4g}] -- IDLE -- [{end:.4g}]"
+    else:
+        yield f"[{start:.4g}] -- {ids[idx]} -- [{end:.4g}]"
+
+
+def timeline_lines(result, mode='expanded'):
+    ids = result.table.ids
+    for entry in result.timeline:
+        yield from entry_lines(entry, ids, mode)
+
+
+def header_lines(title, base_name):
+    # Başlık ve a) bölümünün başlığı; zaman tablosu satırları bunu izler
+    return [f"{title} Sonuçları - {base_name}", "-" * 40, "a) Zaman Tablosu"]
+
+
+def summary_lines(metrics):
+    # Zaman tablosundan sonraki boş satır ve b-f bölümleri; yüzdelikler istendiyse
+    # (metrics['latency']) b ve c bölümlerine P50/P95/P99, sona g ve h bölümleri eklenir
+    latency = metrics.get('latency')
+    output_content = [""]
+
+    # b) Bekleme Süresi
+    output_content.append("b) Maksimum ve Ortalama Bekleme Süresi [Waiting Time]")
+    output_content.append(f"   Maksimum: {metrics['max_wait']:.4f}")
+    output_content.append(f"   Ortalama: {metrics['avg_wait']:.4f}")
+    if latency:
+        output_content.extend(percentile_lines(latency['waiting']))
+    output_content.append("")
+
+    # c) Tamamlanma Süresi
+    output_content.append("c) Maksimum ve Ortalama Tamamlanma Süresi [Turnaround Time]")
+    output_content.append(f"   Maksimum: {metrics['max_turnaround']:.4f}")
+    output_content.append(f"   Ortalama: {metrics['avg_turnaround']:.4f}")
+    if latency:
+        output_content.extend(percentile_lines(latency['turnaround']))
+    output_content.append("")
+
+    # d) Throughput
+    output_content.append("d) T=[50, 100, 150, 200] için İş Tamamlama Sayısı [Throughput]")
+    for t in CHECK_POINTS:
+        output_content.append(f"   T={t}: {metrics['throughput'][t]}")
+    if metrics.get('throughput_curve'):
+        # --throughput-at / --throughput-step ile istenen ek noktalar
+        output_content.append(f"   Ek kontrol noktaları ({len(metrics['throughput_curve'])} nokta):")
+        for t, count in metrics['throughput_curve']:
+            output_content.append(f"   T={t:.10g}: {count}")
+    output_content.append("")
+
+    # e) CPU Verimliliği
+    output_content.append("e) Ortalama CPU Verimliliği")
+    output_content.append(f"   {metrics['cpu_efficiency']:.4%}")
+    cores = metrics.get('cores')
+    if cores:
+        # Çok çekirdekli modda çekirdek başına verimlilik
+        for k, core in enumerate(cores):
+            output_content.append(f"   CPU {k}: {core['efficiency']:.4%}")
+    output_content.append("")
+
+    # f) Bağlam Değiştirme
+    output_content.append("f) Toplam Bağlam Değiştirme Sayısı")
+    output_content.append(f"   {metrics['context_switches']}")
+    if cores:
+        for k, core in enumerate(cores):
+            output_content.append(f"   CPU {k}: {core['context_switches']}")
+
+    if latency:
+        output_content.extend(latency_lines(latency))
+
+    return output_content
+
+
+def format_report(title, base_name, result, timeline_mode='expanded', metrics=None):
+    """Sonuç dosyasının satırlarını döndürür."""
+    if metrics is None:
+        metrics = compute_metrics(result)
+
+    output_content = header_lines(title, base_name)
+    output_content.extend(timeline_lines(result, timeline_mode))
+    output_content.extend(summary_lines(metrics))
+    return output_content
+
+
+def write_throughput_csv(path, series):
+    # İş tamamlama eğrisi: her satırda zaman ve o ana kadar biten iş sayısı
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("Time,Completed\n")
+        for t, count in series:
+            f.write(f"{t:.10g},{count}\n")
+
+
+def write_report(path, lines):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
@@ -0,0 +1,199 @@
+# Ayrıştırılmış iz (trace) önbelleği: CSV'nin ikili bir "sidecar" kopyası.
+# CSV her çalıştırmada yeniden okunup doğrulanmasın ve öncelikler map_priority'den tekrar
+# geçmesin diye ilk yüklemede sütunlar sabit genişlikli diziler olarak yazılır:
+#
+#   [ön başlık] [varış f8] [süre f8] [öncelik f8] [varış sırası i8] [varış tick i8] [süre tick i8] [kimlikler]
+#
+#   - Ön başlık: sihirli dizi, sürüm, öncelik sütunu bayrağı, işlem sayısı, CSV'nin boyutu,
+#     değiştirilme zamanı (ns) ve SHA-256 özeti, ardından bölümlerin konum/uzunlukları
+#   - Diziler dosya sırasındadır; varışa göre kararlı sıralama ('order') önceden hesaplanmış
+#     olarak saklanır, böylece yüklemede sıralama da yapılmaz
+#   - Kimlikler NUL ile ayrılmış tek bir UTF-8 bloğudur
+#
+# Sidecar'lar CSV'nin dizinine değil, sonuç önbelleğinin 'izler' alt klasörüne yazılır; dosya adı
+# CSV'nin adı ve mutlak yolunun özetidir. Sonraki çalıştırmalarda dosya bellek eşlemeli (mmap)
+# açılır. CSV'nin boyutu ve değiştirilme zamanı kayıtlıyla aynıysa sidecar doğrudan kullanılır;
+# sadece zaman farklıysa (ör. git checkout) içerik özeti karşılaştırılır ve eşitse kayıtlı zaman
+# güncellenir. Aksi halde CSV yeniden okunur ve sidecar yeniden yazılır. Boyut, zaman ve özet
+# ayrıştırmadan önce alınır (csv_signature) ve yazarken tekrar kontrol edilir; CSV ayrıştırılırken
+# değişmişse sidecar yazılmaz. Dizin yazılamıyorsa önbellek sessizce atlanır.
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+from .cache import trace_directory
+from .process_table import ProcessTable
+
+MAGIC = b'SCHEDTRC'
+VERSION = 1
+SUFFIX = '.trace.bin'
+
+# Bölümler ve öğe türleri (array / memoryview.cast kodları)
+SECTIONS = [('arrival', 'd'), ('burst', 'd'), ('priority', 'd'), ('order', 'q'),
+            ('arrival_ticks', 'q'), ('burst_ticks', 'q'), ('ids', 'B')]
+
+# magic, sürüm, bayraklar, işlem sayısı, CSV boyutu, CSV mtime (ns), CSV SHA-256, bölüm konum/uzunlukları
+PREAMBLE = struct.Struct('<8sIIQQq32s' + 'QQ' * len(SECTIONS))
+MTIME_OFFSET = struct.calcsize('<8sIIQQ')
+
+FLAG_PRIORITY = 1
+
+
+def sidecar_path(csv_path, directory=None):
+    # directory verilmezse varsayılan önbellek dizininin 'izler' klasörü kullanılır
+    csv_path = os.path.abspath(csv_path)
+    tag = hashlib.sha256(csv_path.encode('utf-8', 'surrogateescape')).hexdigest()[:16]
+    return os.path.join(directory or trace_directory(), f"{os.path.basename(csv_path)}-{tag}{SUFFIX}")
+
+
+def _csv_digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.digest()
+
+
+def csv_signature(csv_path):
+    """CSV'nin (boyut, değiştirilme zamanı, SHA-256 özeti) üçlüsü; okunamazsa None döndürür."""
+    try:
+        st = os.stat(csv_path)
+        return st.st_size, st.st_mtime_ns, _csv_digest(csv_path)
+    except OSError:
+        return None
+
+
+class Sidecar:
+    """Açık (mmap) sidecar dosyası; bölümlere memoryview veya NumPy memmap olarak erişilir."""
+
+    def __init__(self, path, mm, fields):
+        self.path = path
+        self.mm = mm
+        flags, self.count = fields[2], fields[3]
+        self.has_priority = bool(flags & FLAG_PRIORITY)
+        spans = fields[7:]
+        self.sections = {name: (spans[2 * k], spans[2 * k + 1]) for k, (name, _) in enumerate(SECTIONS)}
+
+    def close(self):
+        self.mm.close()
+
+    def view(self, name):
+        # Bölümü kopyalamadan tipli bir memoryview olarak döndürür
+        offset, length = self.sections[name]
+        code = dict(SECTIONS)[name]
+        return memoryview(self.mm)[offset:offset + length].cast(code)
+
+    def ids(self):
+        data = bytes(self.view('ids'))
+        return data.decode('utf-8').split('\x00') if self.count else []
+
+    def to_process_table(self):
+        priority = self.view('priority').tolist() if self.has_priority else None
+        ticks = (self.view('arrival_ticks').tolist(), self.view('burst_ticks').tolist())
+        return ProcessTable(self.ids(), self.view('arrival').tolist(), self.view('burst').tolist(),
+                            priority, order=self.view('order').tolist(), ticks=ticks)
+
+    def arrays(self, np):
+        """(arrival, burst, priority veya None, order) NumPy memmap dizileri."""
+        def mapped(name, dtype):
+            offset, length = self.sections[name]
+            count = length // np.dtype(dtype).itemsize
+            if count == 0:
+                return np.empty(0, dtype=dtype)
+            return np.memmap(self.path, dtype=dtype, mode='r', offset=offset, shape=(count,))
+        priority = mapped('priority', '<f8') if self.has_priority else None
+        return mapped('arrival', '<f8'), mapped('burst', '<f8'), priority, mapped('order', '<i8')
+
+
+def open_sidecar(csv_path, directory=None):
+    """Geçerli bir sidecar varsa açıp döndürür; yoksa veya CSV değişmişse None döndürür."""
+    path = sidecar_path(csv_path, directory)
+    if sys.byteorder != 'little':
+        return None # Diziler küçük sonlu (little-endian) yazılır
+    try:
+        st = os.stat(csv_path)
+        with open(path, 'rb') as f:
+            header = f.read(PREAMBLE.size)
+            if len(header) < PREAMBLE.size:
+                return None
+            fields = PREAMBLE.unpack(header)
+            if fields[0] != MAGIC or fields[1] != VERSION or fields[4] != st.st_size:
+                return None
+            if fields[5] != st.st_mtime_ns:
+                # Sadece zaman değişmişse içerik özeti karşılaştırılır
+                if fields[6] != _csv_digest(csv_path):
+                    return None
+                _touch(path, st.st_mtime_ns)
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, struct.error):
+        return None
+    return Sidecar(path, mm, fields)
+
+
+def _touch(path, mtime_ns):
+    # Kayıtlı CSV zamanını güncelle (içerik aynı)
+    try:
+        with open(path, 'r+b') as f:
+            f.seek(MTIME_OFFSET)
+            f.write(struct.pack('<q', mtime_ns))
+    except OSError:
+        pass
+
+
+def write_sidecar(csv_path, table, directory=None, signature=None):
+    """ProcessTable'ı iz önbelleğine sidecar olarak yazar; başarısız olursa False döndürür.
+
+    signature, tablo ayrıştırılmadan önce alınan csv_signature değeridir; CSV o zamandan beri
+    değişmişse (boyut veya zaman farklıysa) tablo dosyayla eşleşmeyebileceği için yazılmaz.
+    """
+    path = sidecar_path(csv_path, directory)
+    if sys.byteorder != 'little':
+        return False
+    if signature is None:
+        signature = csv_signature(csv_path)
+        if signature is None:
+            return False
+    size, mtime_ns, digest = signature
+    n = len(table)
+    arrival_ticks, burst_ticks = table.ticks()
+    sections = {
+        'arrival': array('d', table.arrival).tobytes(),
+        'burst': array('d', table.burst).tobytes(),
+        'priority': array('d', table.priority).tobytes() if table.has_priority else b'',
+        'order': array('q', table.order).tobytes(),
+        'arrival_ticks': array('q', arrival_ticks).tobytes(),
+        'burst_ticks': array('q', burst_ticks).tobytes(),
+        'ids': '\x00'.join(str(p_id) for p_id in table.ids).encode('utf-8'),
+    }
+    try:
+        st = os.stat(csv_path)
+        if (st.st_size, st.st_mtime_ns) != (size, mtime_ns):
+            return False
+        spans = []
+        offset = PREAMBLE.size
+        for name, _ in SECTIONS:
+            spans += [offset, len(sections[name])]
+            offset += len(sections[name])
+        flags = FLAG_PRIORITY if table.has_priority else 0
+        header = PREAMBLE.pack(MAGIC, VERSION, flags, n, size, mtime_ns, digest, *spans)
+
+        # Geçici dosyaya yazılıp tek adımda yerine taşınır; yarım dosya okunmaz
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.sidecar_')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header)
+                for name, _ in SECTIONS:
+                    f.write(sections[name])
+            os.replace(tmp, path)
+        except OSError:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,541 @@
+# Çok çekirdekli (SMP) ayrık olay simülasyonu.
+# m çekirdeğin her biri kendi saatine, zaman tablosuna ve son çalışan işlemine sahiptir;
+# dilim bitişleri ve bağlam değiştirme sonları tek bir (zaman, çekirdek) min-heap'inde tutulur.
+# Aynı andaki olaylar tek çekirdekteki sırayla işlenir: önce biten dilimler kapatılır
+# (tamamlanma), sonra varışlar alınır, quantum'u dolan işlemler kuyruğa döner; ardından
+# boştaki çekirdeklere iş dağıtılır ve kesmeli politikalarda gerekiyorsa en kötü çalışan
+# işlem kesilir.
+#
+# Hazır kuyruğu düzenleri:
+#   - global : tüm çekirdekler tek bir politika nesnesini (ortak hazır kümesi) paylaşır
+#   - balance: her çekirdeğin kendi kuyruğu vardır; gelen işlem en az yüklü çekirdeğe gider
+#   - steal  : her çekirdeğin kendi kuyruğu vardır; gelenler sırayla dağıtılır, kuyruğu boşalan
+#              çekirdek en uzun kuyruktan iş çalar
+#
+# Çok çekirdekte olay başına O(m) taramadan kaçınılır: balance/steal için kuyruk yükleri tembel
+# silmeli heap'lerde, bekleyen iş sayısı bir sayaçta tutulur. Varışlar çalışan dilimleri kesmez;
+# ortak kuyrukta çalışan çekirdekler running_order anahtarlı bir heap'te durur ve varış anında
+# sadece tepedeki (en kötü) çekirdek durdurulup kesme kontrolü yapılır. Çekirdek kuyruklarında
+# sadece kuyruğuna iş gelen çekirdekler kontrol edilir. Politika olayları (yaşlandırma, öncelik
+# yükseltme) (zaman, kuyruk) heap'inden işletilir.
+#
+# Tek çekirdekte (global) sonuçlar engine.Simulator ile aynıdır. Zamanlar, motordaki gibi
+# tamsayı tick'tir.
+
+import copy
+import heapq
+import math
+import os
+
+from .engine import CONTEXT_SWITCH, SimulationResult
+from .report import entry_lines
+from .ticks import to_ticks, to_units, units_list
+from .timeline import Timeline
+from .writer import ReportWriter
+
+QUEUE_MODES = ['global', 'balance', 'steal']
+QUEUE_LABELS = {
+    'global': "Ortak Kuyruk",
+    'balance': "Çekirdek Kuyrukları, Yük Dengeleme",
+    'steal': "Çekirdek Kuyrukları, İş Çalma",
+}
+
+# Çekirdek durumları
+SWITCHING = 'switch' # Bağlam değiştirme sürüyor
+RUNNING = 'run'
+
+
+class Core:
+    """Bir çekirdeğin durumu ve zaman tablosu."""
+
+    def __init__(self, index):
+        self.index = index
+        self.timeline = Timeline()
+        self.job = None       # Çalışan (veya bağlam değiştirilen) işlem; boşta ise None
+        self.last = None      # Bu çekirdekte en son çalışan işlem (IDLE sonrası None)
+        self.state = None
+        self.slice_start = 0
+        self.run_time = 0
+        self.expired = False
+        self.token = 0        # Olay damgası; kesilen dilimlerin eski olayları böylece atlanır
+        self.fresh_at = None  # Dilim bu anda başladıysa o an (aynı andaki kesme kontrolü atlanır)
+        self.idle_since = 0
+        self.busy = 0         # Toplam çalışma süresi, tick (verimlilik için)
+
+
+class CoreTimelines(list):
+    """Çekirdek zaman tablolarının listesi; toplam bağlam değiştirme sayısını verir."""
+
+    def context_switches(self):
+        return sum(timeline.context_switches() for timeline in self)
+
+
+class SMPResult(SimulationResult):
+
+    def __init__(self, table, cores, completion, first_start, end_time):
+        super().__init__(table, CoreTimelines(core.timeline for core in cores), completion, first_start, end_time)
+        self.cores = cores
+
+
+class SMPSimulator:
+    """m çekirdekli olay güdümlü simülasyon; seçim kararları yine politikalara bırakılır."""
+
+    def __init__(self, table, policy, cpus, queue='global', context_switch=CONTEXT_SWITCH):
+        if queue not in QUEUE_MODES:
+            raise ValueError(f"Bilinmeyen kuyruk düzeni: {queue}")
+        self.table = table
+        self.cpus = cpus
+        self.queue_mode = queue
+        self.context_switch = to_ticks(context_switch)
+        self.preemptive = policy.preemptive
+
+        self.cores = [Core(c) for c in range(cpus)]
+        if queue == 'global':
+            self.queues = [policy]
+            self.policies = [policy] * cpus
+        else:
+            # Bağlanmamış politika nesneleri sadece parametre taşır; kopyalamak yeterlidir
+            self.queues = [policy] + [copy.copy(policy) for _ in range(cpus - 1)]
+            self.policies = self.queues
+
+        n = len(table)
+        self.time = 0
+        self.arrival, burst = table.ticks()
+        self.remaining = list(burst)
+        self.completion = [0] * n
+        self.first_start = [-1] * n
+        self.next_arrival_pos = 0
+
+        self.events = []                 # (zaman, çekirdek, damga)
+        self.idle = list(range(cpus))    # Boştaki çekirdekler (min-heap, küçük indeks önce)
+        self.route_next = 0              # steal düzeninde sıradaki hedef çekirdek
+
+        # Bekleyen iş sayısı = gelen - biten - çekirdeklerdeki (kuyruklar taranmaz)
+        self.admitted = 0
+        self.done = 0
+        self.busy_cores = 0
+
+        # Kuyruk yükleri: balance'ta (yük, çekirdek), steal'de (-uzunluk, çekirdek) min-heap'i.
+        # Değişen çekirdekler işaretlenir ve heap'e sadece sorgu anında yazılır; değeri güncel
+        # olmayan kayıtlar tepeye gelince atılır (tembel silme).
+        self.loads = [(0, c) for c in range(cpus)] if queue != 'global' else []
+        self.pushed = [0] * cpus
+        self.changed = set()
+
+        # Ortak kuyrukta çalışan çekirdekler, en kötü çalışan işlem tepede olacak şekilde
+        # (-sıralama anahtarı, çekirdek, damga); kesme adayı O(log m) sürede bulunur
+        self.running = []
+        # Çekirdek kuyruklarında son kesme kontrolünden beri kuyruğuna iş gelen çekirdekler
+        self.dirty = set()
+
+        # Politika olayları (yaşlandırma, öncelik yükseltme): kuyruk başına bilinen bir sonraki
+        # olay anı, (zaman, kuyruk) heap'i ve çalışan dilimlerin kesildiği en geç olay anı
+        self.policy_event = [None] * len(self.queues)
+        self.timed = []
+        self.bound = [0] * len(self.queues)
+        self.touched = set()             # Bu adımda durumu değişen kuyruklar
+
+    # -- Kuyruk durumu --
+    def _queue_index(self, c):
+        return 0 if self.queue_mode == 'global' else c
+
+    def _load(self, c):
+        if self.queue_mode == 'balance':
+            return len(self.queues[c]) + (self.cores[c].job is not None)
+        return -len(self.queues[c])
+
+    def _touch(self, c):
+        # c çekirdeğinin kuyruğu veya işi değişti: yük kaydını ve politika olayını güncelle
+        self.touched.add(self._queue_index(c))
+        self.changed.add(c)
+
+    def _least_loaded(self):
+        # Tepedeki güncel kayıt: balance'ta en az yüklü, steal'de en uzun kuyruklu çekirdek
+        # (eşitlikte küçük indeks)
+        loads, pushed = self.loads, self.pushed
+        for c in self.changed:
+            load = self._load(c)
+            if load != pushed[c]:
+                pushed[c] = load
+                heapq.heappush(loads, (load, c))
+        self.changed.clear()
+        while loads[0][0] != self._load(loads[0][1]):
+            heapq.heappop(loads)
+        return loads[0][1]
+
+    def _refresh(self, q):
+        nt = self.queues[q].next_event_time()
+        if nt != self.policy_event[q]:
+            self.policy_event[q] = nt
+            if nt is not None:
+                heapq.heappush(self.timed, (nt, q))
+        return nt
+
+    # -- Varışlar --
+    def next_arrival_time(self):
+        if self.next_arrival_pos < len(self.table):
+            return self.arrival[self.table.order[self.next_arrival_pos]]
+        return None
+
+    def route(self, i):
+        # Gelen işlemin gireceği çekirdek (ortak kuyrukta 0)
+        if self.queue_mode == 'global':
+            return 0
+        if self.queue_mode == 'balance':
+            return self._least_loaded()
+        c = self.route_next
+        self.route_next = (c + 1) % self.cpus
+        return c
+
+    def admit_arrivals(self, t):
+        # t anına kadar gelenleri kuyruklara al; varış olduysa True döndürür
+        order, arrival, n = self.table.order, self.arrival, len(self.table)
+        pos = start = self.next_arrival_pos
+        while pos < n and arrival[order[pos]] <= t:
+            i = order[pos]
+            c = self.route(i)
+            self.queues[c].on_arrival(i, t)
+            self._touch(c)
+            if self.preemptive:
+                self.dirty.add(c)
+            pos += 1
+        self.next_arrival_pos = pos
+        self.admitted += pos - start
+
+        # Sadece olayı gelmiş kuyrukların zamanlı olayları işletilir
+        for q in self.touched:
+            self._refresh(q)
+        timed = self.timed
+        while timed and timed[0][0] <= t:
+            due, q = heapq.heappop(timed)
+            if self.policy_event[q] == due:
+                self.queues[q].on_time(t)
+                self.touched.add(q)
+                self._refresh(q)
+        return pos > start
+
+    # -- Çekirdek olayları --
+    def _schedule(self, core, t):
+        core.token += 1
+        heapq.heappush(self.events, (t, core.index, core.token))
+        if core.state == RUNNING and self.running is not None:
+            order = self.policies[core.index].running_order(core.job, core.slice_start)
+            heapq.heappush(self.running, (tuple(-x for x in order), core.index, core.token))
+
+    def _assign(self, core, i, t):
+        # İşlemi çekirdeğe ver; farklı bir işlemse önce bağlam değiştirme yapılır
+        if core.job is None:
+            self.busy_cores += 1
+            if t > core.idle_since:
+                core.timeline.add_idle(core.idle_since, t)
+                core.last = None # IDLE sonrası CS gerekir
+        core.job = i
+        self._touch(core.index)
+        if core.last != i:
+            core.last = i
+            core.state = SWITCHING
+            self._schedule(core, t + self.context_switch)
+        else:
+            self._start_slice(core, t, fresh=True)
+
+    def _start_slice(self, core, t, fresh=False):
+        # Ne kadar çalışacak? (Kalan süre, quantum veya bir sonraki politika olayı).
+        # Varışlar dilimi kesmez; varış anında sadece kesebileceği çekirdek durdurulur.
+        # fresh: dilim bu anda başlıyor (bağlam değiştirme sonu / yeni atama); bu andaki
+        # kesme kontrolleri ona uygulanmaz
+        i = core.job
+        policy = self.policies[core.index]
+        if self.first_start[i] < 0:
+            self.first_start[i] = t
+
+        run_time = self.remaining[i]
+        expired = False
+        quantum = policy.time_slice(i)
+        if quantum is not None and quantum < run_time:
+            run_time = quantum
+            expired = True
+        if self.preemptive:
+            q = self._queue_index(core.index)
+            event_time = policy.next_event_time()
+            if event_time is None:
+                self.bound[q] = math.inf
+            else:
+                self.bound[q] = max(self.bound[q], event_time)
+                if event_time - t < run_time:
+                    run_time = event_time - t
+                    expired = False
+
+        core.state = RUNNING
+        core.slice_start = t
+        core.run_time = run_time
+        core.expired = expired
+        core.fresh_at = t if fresh else None
+        if fresh and self.preemptive:
+            self.dirty.add(core.index)
+        self._schedule(core, t + run_time)
+
+    def _sync(self, core, t):
+        # Çalışan dilimi t anına kadar kaydet (bitiş olayı değişmez; zaman tablosunda birleşir)
+        elapsed = t - core.slice_start
+        if elapsed > 0:
+            core.timeline.add(core.slice_start, core.job, t)
+            core.busy += elapsed
+            self.remaining[core.job] -= elapsed
+            core.slice_start = t
+            core.run_time -= elapsed
+
+    def _release(self, core, t):
+        core.job = None
+        core.state = None
+        core.idle_since = t
+        self.busy_cores -= 1
+        heapq.heappush(self.idle, core.index)
+        self._touch(core.index)
+
+    def _end_slice(self, core, t):
+        # Dilimi kapatır; işlem bitmediyse True döner
+        i = core.job
+        policy = self.policies[core.index]
+        core.timeline.add(core.slice_start, i, t)
+        core.busy += core.run_time
+        self.remaining[i] -= core.run_time
+        core.token += 1 # Çalışan çekirdek heap'indeki kaydı geçersiz kılar
+
+        if self.remaining[i] == 0:
+            self.completion[i] = t
+            self.done += 1
+            policy.on_complete(i)
+            self._release(core, t)
+            return False
+        return True
+
+    def _expire(self, core, t):
+        # Quantum'u dolan işlem kuyruğa döner (varışlardan sonra); değilse devam adayıdır
+        if not core.expired:
+            return False
+        self.policies[core.index].on_quantum_expiry(core.job, t)
+        self._release(core, t)
+        return True
+
+    def _cut_slices(self):
+        # Bu adımda öne gelen bir politika olayı (ör. yeniden kuyruğa girişin yaşlandırması),
+        # çalışan dilimlerin kesildiği sınırdan önceyse o dilimler olay anında kesilir
+        for q in self.touched:
+            policy_t = self._refresh(q)
+            if policy_t is None or policy_t >= self.bound[q]:
+                continue
+            cores = self.cores if self.queue_mode == 'global' else [self.cores[q]]
+            for core in cores:
+                if core.state == RUNNING and core.slice_start < policy_t < core.slice_start + core.run_time:
+                    core.run_time = policy_t - core.slice_start
+                    core.expired = False
+                    self._schedule(core, core.slice_start + core.run_time)
+            self.bound[q] = policy_t
+
+    # -- Dağıtım --
+    def _dispatch(self, t, pending, arrived):
+        if self.queue_mode == 'global':
+            continuing = self._dispatch_global(t, pending, arrived)
+        else:
+            continuing = self._dispatch_local(t, pending, arrived)
+        for core in continuing:
+            # Kesilmeyen işlem bağlam değiştirmeden devam eder (dilimler birleştirilir)
+            self._start_slice(core, t)
+
+    def _preempt(self, core, policy, t):
+        policy.on_preempt(core.job, t)
+        core.job, core.state = None, None
+        core.idle_since = t
+        self.busy_cores -= 1
+        self._assign(core, policy.select(t), t)
+
+    def _worst_running(self, t, skipped):
+        # Bu anda kesilebilecek en kötü çalışan çekirdek (yeni başlayan dilimler atlanır)
+        running, cores = self.running, self.cores
+        while running:
+            _, c, token = running[0]
+            core = cores[c]
+            if token != core.token or core.state != RUNNING:
+                heapq.heappop(running)
+            elif core.fresh_at == t:
+                skipped.append(heapq.heappop(running))
+            else:
+                return core
+        return None
+
+    def _dispatch_global(self, t, pending, arrived):
+        policy = self.queues[0]
+        idle = self.idle
+        while idle and policy:
+            self._assign(self.cores[heapq.heappop(idle)], policy.select(t), t)
+        if not self.preemptive:
+            return pending
+
+        # Boş çekirdek kalmadıysa bekleyen en iyi işlem, çalışanların en kötüsünü keser.
+        # Adaylar bu anda dilimi biten çekirdeklerle, varış olduysa çalışan tüm çekirdeklerdir.
+        continuing = list(pending)
+        skipped = []
+        while policy:
+            victim = max(continuing, key=lambda core: policy.running_key(core.job)) if continuing else None
+            if arrived:
+                worst = self._worst_running(t, skipped)
+                if worst is not None:
+                    self._sync(worst, t)
+                    if victim is None or policy.running_key(worst.job) > policy.running_key(victim.job):
+                        victim = worst
+            if victim is None or not policy.should_preempt(victim.job):
+                break
+            if victim in continuing:
+                continuing.remove(victim)
+            else:
+                victim.token += 1 # Eski dilim bitiş olayı ve heap kaydı geçersiz
+            self._preempt(victim, policy, t)
+        for entry in skipped:
+            heapq.heappush(self.running, entry)
+        return continuing
+
+    def _dispatch_local(self, t, pending, arrived):
+        queues, cores = self.queues, self.cores
+        # Boş çekirdekler sadece bekleyen iş kaldıkça taranır
+        waiting = self.admitted - self.done - self.busy_cores if self.idle else 0
+        if waiting:
+            still_idle = []
+            while self.idle and waiting:
+                c = heapq.heappop(self.idle)
+                own = queues[c]
+                if not own and self.queue_mode == 'steal':
+                    # En uzun kuyruktan en öndeki işlemi çal
+                    victim = self._least_loaded()
+                    i = queues[victim].select(t)
+                    queues[victim].on_migrate(i)
+                    own.on_migrate_in(i, t)
+                    self._touch(victim)
+                    self._touch(c)
+                if own:
+                    self._assign(cores[c], own.select(t), t)
+                    waiting -= 1
+                else:
+                    still_idle.append(c)
+            for c in still_idle:
+                heapq.heappush(self.idle, c)
+        if not self.preemptive:
+            return pending
+
+        # Adaylar: dilimi bu anda biten çekirdekler ve varış anında, son kontrolden beri
+        # kuyruğuna iş gelen çalışan çekirdekler (diğerlerinin kuyruğu değişmemiştir)
+        candidates = {core.index: core for core in pending}
+        if arrived:
+            for c in self.dirty:
+                core = cores[c]
+                if core.state == RUNNING and core.fresh_at != t and c not in candidates:
+                    self._sync(core, t)
+                    candidates[c] = core
+        ended = set(core.index for core in pending)
+        continuing = []
+        for c in sorted(candidates):
+            core = candidates[c]
+            self.dirty.discard(c)
+            own = queues[c]
+            if own.should_preempt(core.job):
+                if c not in ended:
+                    core.token += 1 # Eski dilim bitiş olayı geçersiz
+                self._preempt(core, own, t)
+            elif c in ended:
+                continuing.append(core)
+        return continuing
+
+    def _next_time(self):
+        t = self.events[0][0] if self.events else None
+        # Varışlar boş çekirdek varsa, çekirdek kuyruklarında (yönlendirme anı) veya
+        # kesmeli politikalarda karar anıdır; aksi halde bir sonraki olayda alınırlar
+        if self.idle or self.queue_mode != 'global' or self.preemptive:
+            arrival = self.next_arrival_time()
+            if arrival is not None and (t is None or arrival < t):
+                t = arrival
+        return t
+
+    def run(self):
+        for policy in self.queues:
+            policy.bind(self)
+        if not (self.preemptive and self.queue_mode == 'global'):
+            self.running = None
+        events, cores = self.events, self.cores
+
+        while True:
+            t = self._next_time()
+            if t is None:
+                break # Hepsi bitti
+            self.time = t
+
+            # 1. aşama: bu andaki bağlam değiştirme sonları ve dilim bitişleri (çekirdek sırasıyla)
+            switched, ended = [], []
+            while events and events[0][0] <= t:
+                _, c, token = heapq.heappop(events)
+                core = cores[c]
+                if token != core.token:
+                    continue # Kesilmiş dilimin eski olayı
+                if core.state == SWITCHING:
+                    switched.append(core)
+                elif self._end_slice(core, t):
+                    ended.append(core)
+            arrived = self.admit_arrivals(t)
+            for core in switched:
+                self._start_slice(core, t, fresh=True)
+            pending = [core for core in ended if not self._expire(core, t)]
+
+            # 2. aşama: boş çekirdeklere dağıtım ve kesme kontrolleri
+            self._dispatch(t, pending, arrived)
+            if self.preemptive:
+                self._cut_slices()
+            self.touched.clear()
+
+        end_time = max(self.completion) if self.completion else 0
+        return SMPResult(self.table, cores, units_list(self.completion), units_list(self.first_start),
+                         to_units(end_time))
+
+
+def smp_metrics(result, metrics):
+    # Toplam verimlilik m çekirdeğin toplam süresine göre; çekirdek başına verimlilik ve CS sayısı
+    end_time, cpus = result.end_time, len(result.cores)
+    if end_time > 0:
+        metrics['cpu_efficiency'] /= cpus
+    metrics['cores'] = [{
+        'efficiency': to_units(core.busy) / end_time if end_time > 0 else 0,
+        'context_switches': core.timeline.context_switches(),
+    } for core in result.cores]
+    return metrics
+
+
+def run_smp(policy, input_path, cpus, queue='global', columnar=False, compression=None,
+            percentiles=None, curve=None, profiler=None, trace_cache=True):
+    """Çok çekirdekli modda simüle eder ve sonuç dosyasını yazar; (dosya adı, metrikler) döndürür.
+
+    Profil açıksa sadece aşama süreleri ölçülür; çekirdek kuyrukları politika kopyaları
+    olduğundan sayaç vekilleri bu modda kullanılmaz.
+    """
+    from .cli import load_for_policy, output_filename, result_metrics, throughput_filename
+    from .profiling import phase
+    from .report import write_throughput_csv
+
+    with phase(profiler, 'load'):
+        table, columns = load_for_policy(policy, input_path, columnar, trace_cache)
+    with phase(profiler, 'simulate'):
+        result = SMPSimulator(table, policy, cpus, queue).run()
+    with phase(profiler, 'metrics'):
+        metrics = smp_metrics(result, result_metrics(result, columns, percentiles, curve))
+
+    filename = output_filename(policy, input_path, f"_cpu{cpus}", compression)
+    title = f"{policy.title()} ({cpus} CPU, {QUEUE_LABELS[queue]})"
+    with phase(profiler, 'write'), ReportWriter(filename, compression) as writer:
+        writer.write_header(title, os.path.basename(input_path))
+        for core in result.cores:
+            writer.write_line(f"CPU {core.index}:")
+            for entry in core.timeline:
+                for line in entry_lines(entry, table.ids):
+                    writer.write_line(line)
+        writer.write_summary(metrics)
+
+    if curve is not None:
+        with phase(profiler, 'write'):
+            write_throughput_csv(throughput_filename(policy, input_path), metrics['throughput_curve'])
+    return filename, metrics
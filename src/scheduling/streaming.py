@@ -0,0 +1,218 @@
+# Sınırlı bellekli akış (streaming) simülasyonu.
+# CSV dosyası satır satır okunur; bellekte sadece hazır kümesindeki ve CPU'daki işlemler
+# tutulur. Biten işlemler anında özet istatistiklere (RunningMetrics) katılıp silinir,
+# zaman tablosu dilimleri de kesinleştikçe dosyaya yazılır. Böylece en yüksek bellek
+# kullanımı dosya uzunluğuna değil, hazır kuyruğunun en büyük derinliğine bağlıdır.
+# Not: Akış modu, dosyanın varış zamanına göre sıralı olmasını gerektirir.
+
+import math
+import os
+
+from .cli import output_filename, throughput_filename
+from .engine import CONTEXT_SWITCH, Simulator
+from .loader import iter_rows, map_priority
+from .metrics import LatencyCollector
+from .profiling import phase
+from .report import CHECK_POINTS, write_throughput_csv
+from .ticks import to_ticks, to_units
+from .writer import ReportWriter, StreamingTimeline
+
+
+class StreamingTable:
+    """Sadece canlı (gelmiş ama bitmemiş) işlemleri tutan süreç tablosu."""
+
+    def __init__(self, has_priority):
+        self.ids = {}
+        self.arrival = {}
+        self.burst = {}
+        self.priority = {} if has_priority else None
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def has_priority(self):
+        return self.priority is not None
+
+    def add(self, i, p_id, arrival, burst, priority):
+        self.ids[i] = p_id
+        self.arrival[i] = arrival
+        self.burst[i] = burst
+        if self.priority is not None:
+            self.priority[i] = priority
+
+    def remove(self, i):
+        del self.ids[i]
+        del self.arrival[i]
+        del self.burst[i]
+        if self.priority is not None:
+            del self.priority[i]
+
+
+class RunningMetrics:
+    """Biten işlemlerden a-f metriklerini sabit bellekte biriktirir."""
+
+    def __init__(self, percentiles=None, curve=None):
+        self.count = 0
+        self.sum_wait = 0.0
+        self.max_wait = -math.inf
+        self.sum_turnaround = 0.0
+        self.max_turnaround = -math.inf
+        self.total_burst = 0.0
+        self.throughput = {t: 0 for t in CHECK_POINTS}
+        # Yüzdelikler istendiyse gecikme dağılımları (sketch modunda sabit bellek)
+        self.latency = LatencyCollector(percentiles) if percentiles else None
+        # Ek throughput noktaları (ThroughputCurve sayaçları)
+        self.curve = curve
+
+    def add(self, arrival, burst, completion, first_start, priority=None):
+        # Turnaround = Completion - Arrival, Waiting = Turnaround - Burst
+        turnaround = completion - arrival
+        waiting = turnaround - burst
+        self.count += 1
+        self.sum_wait += waiting
+        self.max_wait = max(self.max_wait, waiting)
+        self.sum_turnaround += turnaround
+        self.max_turnaround = max(self.max_turnaround, turnaround)
+        self.total_burst += burst
+        for t in CHECK_POINTS:
+            if completion <= t:
+                self.throughput[t] += 1
+        if self.latency is not None:
+            self.latency.add(arrival, burst, completion, first_start, priority)
+        if self.curve is not None:
+            self.curve.add(completion)
+
+    def as_dict(self, end_time, context_switches):
+        metrics = {
+            'max_wait': self.max_wait,
+            'avg_wait': self.sum_wait / self.count,
+            'max_turnaround': self.max_turnaround,
+            'avg_turnaround': self.sum_turnaround / self.count,
+            'throughput': dict(self.throughput),
+            'cpu_efficiency': self.total_burst / end_time if end_time > 0 else 0,
+            'context_switches': context_switches,
+        }
+        if self.latency is not None:
+            metrics['latency'] = self.latency.as_dict()
+        if self.curve is not None:
+            metrics['throughput_curve'] = self.curve.series(end_time)
+        return metrics
+
+
+class StreamingResult:
+
+    def __init__(self, metrics, end_time, processed, peak_live):
+        self.metrics = metrics
+        self.end_time = end_time
+        self.processed = processed  # Toplam işlenen işlem sayısı
+        self.peak_live = peak_live  # Aynı anda bellekte tutulan en fazla işlem
+
+
+class StreamingSimulator(Simulator):
+    """Simulator'ın varışları dosyadan artımlı okuyan ve bitenleri bırakan sürümü."""
+
+    def __init__(self, rows, has_priority, policy, emit, timeline_mode='expanded',
+                 context_switch=CONTEXT_SWITCH, percentiles=None, curve=None):
+        # rows: (id, varış, süre, öncelik) demetleri üreten, varışa göre sıralı bir akış
+        self.rows = iter(rows)
+        self.percentiles = percentiles
+        self.curve = curve
+        table = StreamingTable(has_priority)
+        super().__init__(table, policy, context_switch, StreamingTimeline(emit, table.ids, timeline_mode))
+
+    def _init_state(self):
+        # Canlı işlemlerin tick cinsinden varış ve kalan süreleri
+        self.arrival = {}
+        self.remaining = {}
+        self.first_start = {}
+        self.metrics = RunningMetrics(self.percentiles, self.curve)
+        self.next_index = 0
+        self.peak_live = 0
+        self._peek = None
+        self._peek_arrival = None
+        self._advance()
+
+    def _advance(self):
+        previous = self._peek
+        self._peek = next(self.rows, None)
+        if self._peek is None:
+            self._peek_arrival = None
+            return
+        if previous is not None and self._peek[1] < previous[1]:
+            raise ValueError(f"Akış modu varış zamanına göre sıralı dosya gerektirir "
+                             f"({self._peek[0]} işlemi {previous[0]} işleminden önce geliyor).")
+        self._peek_arrival = to_ticks(self._peek[1])
+
+    def next_arrival_time(self):
+        return self._peek_arrival
+
+    def admit_arrivals(self, t):
+        table = self.table
+        while self._peek is not None and self._peek_arrival <= t:
+            p_id, arrival, burst, priority = self._peek
+            i = self.next_index
+            self.next_index += 1
+            table.add(i, p_id, arrival, burst, priority)
+            self.arrival[i] = self._peek_arrival
+            self.remaining[i] = to_ticks(burst)
+            self.first_start[i] = -1
+            self.policy.on_arrival(i, t)
+            self._advance()
+        self.peak_live = max(self.peak_live, len(table))
+        self.policy.on_time(t)
+
+    def on_complete(self, i):
+        # Biten işlemi özet istatistiklere kat ve bellekten sil
+        table = self.table
+        priority = table.priority[i] if table.has_priority else None
+        self.metrics.add(table.arrival[i], table.burst[i], to_units(self.time), to_units(self.first_start[i]), priority)
+        self.policy.on_complete(i)
+        table.remove(i)
+        del self.arrival[i]
+        del self.remaining[i]
+        del self.first_start[i]
+
+    def result(self):
+        self.timeline.flush()
+        end_time = to_units(self.time)
+        metrics = self.metrics.as_dict(end_time, self.timeline.context_switches())
+        return StreamingResult(metrics, end_time, self.next_index, self.peak_live)
+
+
+def parse_rows(rows):
+    # Ham metin satırlarını sayısal demetlere çevir
+    for k, (p_id, arrival, burst, priority) in enumerate(rows):
+        try:
+            arrival, burst = float(arrival), float(burst)
+        except ValueError:
+            raise ValueError(f"{k + 1}. veri satırı: geçersiz varış/süre değeri") from None
+        yield p_id, arrival, burst, map_priority(priority) if priority is not None else None
+
+
+def run_streaming(policy, input_path, timeline_mode='expanded', compression=None, percentiles=None, curve=None,
+                  profiler=None):
+    """Akış modunda simüle eder ve sonuç dosyasını yazar; dosya adını döndürür.
+
+    Satırlar simülasyon ilerledikçe okunduğu ve metrikler biten işlemlerle biriktirildiği için
+    profilde okuma ve metrik hesabı 'simulate' aşamasına dahildir.
+    """
+    info, rows = iter_rows(input_path, require_priority=policy.needs_priority)
+    filename = output_filename(policy, input_path, compression=compression)
+
+    with ReportWriter(filename, compression, profiler=profiler) as writer:
+        # Başlık ve zaman tablosu ilerledikçe yazılır, özet en sonda eklenir
+        writer.write_header(policy.title(), os.path.basename(input_path))
+        with phase(profiler, 'simulate'):
+            sim = StreamingSimulator(parse_rows(rows), info['has_priority'], policy, writer.write_line, timeline_mode,
+                                     percentiles=percentiles, curve=curve)
+            if profiler is not None:
+                profiler.instrument(sim)
+            result = sim.run()
+        writer.write_summary(result.metrics)
+
+    if curve is not None:
+        with phase(profiler, 'write'):
+            write_throughput_csv(throughput_filename(policy, input_path), result.metrics['throughput_curve'])
+
+    return filename
@@ -0,0 +1,152 @@
+# Round Robin quantum taraması ve otomatik ayar.
+# CSV bir kez okunur; quantum değerleri paylaşılan tablo üzerinde paralel simüle edilir.
+# Sonuçlar quantum başına önbelleğe alınır, böylece tarama ve otomatik ayar boyunca
+# aynı quantum hiçbir zaman iki kez simüle edilmez.
+
+import argparse
+import os
+from itertools import repeat
+
+from .cache import trace_cache_from_args
+from .compare import comparison_lines, process_pool, shared_table
+from .engine import simulate
+from .loader import load_processes
+from .policies import RoundRobin
+from .report import compute_metrics, write_report
+
+# Otomatik ayarda en küçüklenebilecek metrikler
+OBJECTIVES = ['avg_wait', 'max_wait', 'avg_turnaround', 'max_turnaround', 'context_switches']
+
+
+def _evaluate(quantum, fast_forward, table=None):
+    # Tek bir quantum değerini simüle edip a-f metriklerini döndürür
+    if table is None:
+        table = shared_table()
+    return compute_metrics(simulate(table, RoundRobin(quantum, fast_forward)))
+
+
+class QuantumSweep:
+    """Quantum -> metrikler önbelleğiyle Round Robin değerlendirici."""
+
+    def __init__(self, table, workers=None, fast_forward=False):
+        self.table = table
+        self.workers = workers
+        self.fast_forward = fast_forward
+        self.cache = {}
+
+    def evaluate(self, quanta):
+        # Sadece önbellekte olmayan quantum değerleri simüle edilir
+        todo = [q for q in dict.fromkeys(quanta) if q not in self.cache]
+        if self.workers == 1 or len(todo) == 1:
+            results = [_evaluate(q, self.fast_forward, self.table) for q in todo]
+        elif todo:
+            with process_pool(self.table, self.workers, len(todo)) as executor:
+                results = list(executor.map(_evaluate, todo, repeat(self.fast_forward)))
+        else:
+            results = []
+        self.cache.update(zip(todo, results))
+        return {q: self.cache[q] for q in quanta}
+
+    def auto_tune(self, low, high, objective, points=8):
+        """[low, high] aralığında objective'i en küçükleyen quantum'u arar.
+
+        Önce aralık 'points' noktalı kaba bir ızgarayla taranır, ardından en iyi noktanın
+        komşu ızgara aralığı daha sıkı bir ızgarayla yeniden taranır; adım 1 olunca durulur.
+        """
+        if low > high:
+            raise ValueError(f"Geçersiz quantum aralığı: {low} > {high}")
+        if points < 2:
+            raise ValueError("Izgara en az iki noktalı olmalıdır")
+        lo, hi = low, high
+        while True:
+            step = max(1, (hi - lo) // (points - 1))
+            grid = list(range(lo, hi + 1, step))
+            if grid[-1] != hi:
+                grid.append(hi)
+            results = self.evaluate(grid)
+            # Eşitlikte küçük quantum tercih edilir
+            best = min(grid, key=lambda q: (results[q][objective], q))
+            if step == 1:
+                return best
+            lo, hi = max(low, best - step), min(high, best + step)
+
+
+def parse_quanta(args):
+    # --quanta listesi ve --range BAŞLANGIÇ BİTİŞ [ADIM] birleştirilir (sıra korunur).
+    # Otomatik ayarda --range sadece arama sınırlarını belirtir.
+    quanta = list(args.quanta or [])
+    if args.range and not args.auto_tune:
+        start, stop = args.range[0], args.range[1]
+        step = args.range[2] if len(args.range) > 2 else 1
+        quanta.extend(range(start, stop + 1, step))
+    return list(dict.fromkeys(quanta))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Round Robin Quantum Taraması ve Otomatik Ayar")
+    parser.add_argument('input_file', type=str, help='İşlenecek CSV dosyasının yolu')
+    parser.add_argument('--quanta', nargs='+', type=int, default=None,
+                        help='Denenecek quantum değerleri (ör. --quanta 2 5 10 20)')
+    parser.add_argument('--range', nargs='+', type=int, default=None, metavar='N',
+                        help='Quantum aralığı: BAŞLANGIÇ BİTİŞ [ADIM] (bitiş dahil)')
+    parser.add_argument('--auto-tune', action='store_true',
+                        help='Aralıkta (--range, varsayılan 1-100) en iyi quantum değerini ara')
+    parser.add_argument('--objective', choices=OBJECTIVES, default='avg_wait',
+                        help='Otomatik ayarda en küçüklenecek metrik (Varsayılan: avg_wait)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Paralel işçi sayısı (Varsayılan: CPU sayısı, 1 = seri)')
+    parser.add_argument('--fast-forward', action='store_true',
+                        help='Kararlı durumdaki tam turları aritmetik olarak tek adımda ilerlet')
+    # Tarama sonuç önbelleğini kullanmaz; yalnızca ayrıştırılmış iz önbelleği ayarları geçerlidir
+    group = parser.add_argument_group('İz önbelleği')
+    group.add_argument('--cache-dir', type=str, default=None,
+                       help='Önbellek dizini (Varsayılan: $SCHED_CACHE_DIR veya ~/.cache/eblm341_scheduling)')
+    group.add_argument('--no-trace-cache', action='store_true',
+                       help='Ayrıştırılmış ikili iz önbelleğini (izler/*.trace.bin) okuma ve yazma')
+    args = parser.parse_args(argv)
+
+    if args.range is not None and len(args.range) not in (2, 3):
+        parser.error("--range için BAŞLANGIÇ BİTİŞ [ADIM] verilmelidir")
+    if any(v < 1 for v in (args.quanta or []) + (args.range or [])):
+        parser.error("Quantum değerleri ve adım 1 veya daha büyük olmalıdır")
+    if args.range is not None and args.range[0] > args.range[1]:
+        parser.error("--range için BAŞLANGIÇ, BİTİŞ değerinden büyük olamaz")
+    quanta = parse_quanta(args)
+    if not quanta and not args.auto_tune:
+        parser.error("--quanta, --range veya --auto-tune seçeneklerinden biri gerekli")
+
+    input_path = args.input_file
+    base_name = os.path.basename(input_path)
+    raw_name = os.path.splitext(base_name)[0]
+
+    try:
+        table = load_processes(input_path, trace_cache=trace_cache_from_args(args))
+        sweep = QuantumSweep(table, args.workers, args.fast_forward)
+
+        best = None
+        if args.auto_tune:
+            low, high = (args.range[0], args.range[1]) if args.range else (1, 100)
+            best = sweep.auto_tune(low, high, args.objective)
+
+        # Rapor: istenen ve otomatik ayarda denenen tüm quantum değerleri artan sırada
+        shown = sorted(set(quanta) | set(sweep.cache))
+        results = sweep.evaluate(shown)
+        rows = [(RoundRobin(q).title(), None, results[q]) for q in shown]
+
+        lines = comparison_lines(base_name, rows, heading="Round Robin Quantum Taraması")
+        if best is not None:
+            value = sweep.cache[best][args.objective]
+            value = f"{value:.4f}" if isinstance(value, float) else value
+            lines.append("")
+            lines.append(f"En iyi quantum ({args.objective}): {best} -> {value}")
+        lines.append(f"Simüle edilen quantum sayısı: {len(sweep.cache)}")
+
+        summary_filename = f"rr_tarama_{raw_name}.txt"
+        write_report(summary_filename, lines)
+
+        print("\n".join(lines))
+        print()
+        print(f"İşlem Tamamlandı. Tarama tablosu '{summary_filename}' dosyasına yazıldı.")
+
+    except Exception as e:
+        print(f"Hata oluştu: {e}")
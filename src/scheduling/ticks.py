@@ -0,0 +1,26 @@
+# Tamsayı zaman tabanı.
+# Simülasyon içinde tüm zamanlar ve süreler tamsayı tick olarak tutulur: 1 birim = 10^6 tick,
+# böylece bağlam değiştirme (0.001) tam 1000 tick'tir. Toplama/çıkarma kesin olduğundan
+# float toleranslarına (1e-9) ve artık (residue) dilimlere gerek kalmaz; aynı girdi her
+# zaman aynı sonucu verir. Değerler sadece çıktı tarafında (sonuç ve zaman tablosu) birime çevrilir.
+# Not: Girdideki varış/süre değerleri en yakın tick'e (10^-6 birim) yuvarlanır.
+
+TICKS_PER_UNIT = 1_000_000
+
+
+def to_ticks(value):
+    return round(value * TICKS_PER_UNIT)
+
+
+def to_units(ticks):
+    return ticks / TICKS_PER_UNIT
+
+
+def ticks_list(values):
+    scale = TICKS_PER_UNIT
+    return [round(v * scale) for v in values]
+
+
+def units_list(values):
+    scale = TICKS_PER_UNIT
+    return [v / scale for v in values]
@@ -0,0 +1,75 @@
+# Zaman tablosu (Gantt) verisi.
+# Her kayıt bir listedir: [başlangıç, işlem indeksi, bitiş]
+# IDLE kayıtlarında indeks IDLE, hızlı ilerletilmiş Round Robin turlarında ROUND'dur:
+# [başlangıç, ROUND, bitiş, tur sayısı, üye indeksleri, quantum, bağlam değiştirme,
+#  başlangıç tick'i]
+# Simülasyon add* metotlarına tamsayı tick verir; kayıtlar birim cinsinden saklanır.
+# ROUND kayıtlarında quantum, bağlam değiştirme ve başlangıç tick'i tamsayı tick
+# olarak tutulur; dilimler tamsayıda açılıp yalnızca yazılırken birime çevrilir.
+
+from .ticks import TICKS_PER_UNIT
+
+IDLE = -1
+ROUND = -2
+
+
+class Timeline:
+    """Simülasyon boyunca oluşan zaman dilimleri (ardışık dilimler birleştirilir)."""
+
+    def __init__(self):
+        self.entries = []
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, start, idx, end):
+        self.add_entry(start / TICKS_PER_UNIT, idx, end / TICKS_PER_UNIT)
+
+    def add_idle(self, start, end):
+        self.add(start, IDLE, end)
+
+    def add_rounds(self, start, end, rounds, members, quantum, context_switch):
+        # Tekrarlanan tur bloğu; her turda üyeler sırayla birer quantum çalışır
+        scale = TICKS_PER_UNIT
+        self.add_round_entry([start / scale, ROUND, end / scale, rounds, tuple(members),
+                              quantum, context_switch, start])
+
+    def add_entry(self, start, idx, end):
+        # --- MERGE (BİRLEŞTİRME) MANTIĞI ---
+        # Eğer son kayıt aynı işleme aitse VE arada zaman farkı yoksa süresini uzat.
+        # Değerler aynı tamsayı tick'lerden çevrildiği için eşitlik kesindir.
+        entries = self.entries
+        if entries and entries[-1][1] == idx and entries[-1][2] == start:
+            entries[-1][2] = end
+        else:
+            entries.append([start, idx, end])
+
+    def add_round_entry(self, entry):
+        self.entries.append(entry)
+
+    def context_switches(self):
+        # IDLE olmayan her blok bir bağlam değiştirme sonucu oluşmuştur;
+        # tur blokları içerdikleri her dilim için bir sayılır.
+        count = 0
+        for entry in self.entries:
+            if entry[1] == ROUND:
+                count += entry[3] * len(entry[4])
+            elif entry[1] != IDLE:
+                count += 1
+        return count
+
+
+def expand_rounds(entry):
+    # Tur bloğunu tek tek dilimlere aç: (başlangıç, indeks, bitiş)
+    # Hesap tamsayı tick'lerde yapılır; birikimli float hatası oluşmaz.
+    _, _, _, rounds, members, quantum, context_switch, start = entry
+    scale = TICKS_PER_UNIT
+    slot = quantum + context_switch
+    round_length = len(members) * slot
+    for r in range(rounds):
+        for j, idx in enumerate(members):
+            s = start + r * round_length + j * slot + context_switch
+            yield s / scale, idx, (s + quantum) / scale
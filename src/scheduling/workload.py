@@ -0,0 +1,233 @@
+# Tohumlu (seed) sentetik iş yükü üreteci.
+# Ödevdeki CSV şemasında (Process_ID, Arrival_Time, CPU_Burst_Time, Priority) büyük izler üretir.
+# Aynı tohum ve parametrelerle her zaman aynı dosya üretilir.
+#
+#   Varış süreçleri:
+#     - poisson: sabit hızlı Poisson süreci (üstel varışlar arası süre)
+#     - mmpp:    iki durumlu Markov modülasyonlu Poisson; sakin ve yoğun dönemler arasında
+#                üstel sürelerle geçiş yapar (patlamalı / bursty yük)
+#     - diurnal: hızı sinüs biçiminde değişen Poisson süreci (gün içi yük döngüsü),
+#                inceltme (thinning) yöntemiyle üretilir
+#   Süre (burst) dağılımları: exponential, lognormal, bimodal (kısa/uzun iş karışımı), pareto
+#   Öncelik karışımı: high/normal/low oranları (veya öncelik sütunu olmadan)
+#
+# Satırlar üretildikçe tamponlu olarak yazılır; bellek kullanımı satır sayısından bağımsızdır,
+# bu yüzden 10^7 satırlık izler de üretilebilir.
+
+import argparse
+import math
+import random
+from bisect import bisect_right
+
+ARRIVALS = ['poisson', 'mmpp', 'diurnal']
+BURSTS = ['exponential', 'lognormal', 'bimodal', 'pareto']
+PRIORITY_LABELS = ['high', 'normal', 'low']
+HEADER = "Process_ID,Arrival_Time,CPU_Burst_Time,Priority"
+
+
+def poisson_arrivals(rng, rate):
+    t = 0.0
+    while True:
+        yield t
+        t += rng.expovariate(rate)
+
+
+def mmpp_arrivals(rng, rate, peak_factor=10.0, quiet_time=200.0, peak_time=20.0):
+    # Sakin durumda hız 'rate', yoğun durumda 'rate * peak_factor'.
+    # Durum süreleri üsteldir (ortalama quiet_time / peak_time). Üstel dağılım belleksiz
+    # olduğundan, durum değişimi bir sonraki varıştan önce gelirse örnek yeniden çekilir.
+    rates = (rate, rate * peak_factor)
+    switch = (1 / quiet_time, 1 / peak_time)
+    t = 0.0
+    state = 0
+    yield t
+    while True:
+        gap = rng.expovariate(rates[state])
+        change = rng.expovariate(switch[state])
+        if change < gap:
+            t += change
+            state = 1 - state
+            continue
+        t += gap
+        yield t
+
+
+def diurnal_arrivals(rng, rate, period=1440.0, amplitude=0.8):
+    # Hız(t) = rate * (1 + amplitude * sin(2πt / period)); ortalama hız 'rate'.
+    # Tepe hızla üretilen adaylar Hız(t) / tepe olasılığıyla kabul edilir.
+    peak = rate * (1 + amplitude)
+    omega = 2 * math.pi / period
+    t = 0.0
+    yield t
+    while True:
+        t += rng.expovariate(peak)
+        if rng.random() * (1 + amplitude) <= 1 + amplitude * math.sin(omega * t):
+            yield t
+
+
+def burst_sampler(rng, kind, mean, sigma=1.0, long_fraction=0.1, long_factor=20.0, alpha=1.5):
+    """Ortalaması 'mean' olan süre örnekleyicisi (argümansız fonksiyon) döndürür."""
+    if kind == 'exponential':
+        rate = 1 / mean
+        return lambda: rng.expovariate(rate)
+    if kind == 'lognormal':
+        # E[X] = exp(mu + sigma^2 / 2) = mean
+        mu = math.log(mean) - sigma * sigma / 2
+        return lambda: rng.lognormvariate(mu, sigma)
+    if kind == 'bimodal':
+        # Kısa ve uzun işlerin üstel karışımı; uzun işlerin ortalaması kısalarınkinin long_factor katı
+        short = mean / (1 - long_fraction + long_fraction * long_factor)
+        short_rate, long_rate = 1 / short, 1 / (short * long_factor)
+        return lambda: rng.expovariate(long_rate if rng.random() < long_fraction else short_rate)
+    if kind == 'pareto':
+        # E[X] = xm * alpha / (alpha - 1); alpha <= 2 için varyans sonsuzdur (ağır kuyruk)
+        if alpha <= 1:
+            raise ValueError("Pareto dağılımı için alpha 1'den büyük olmalıdır.")
+        xm = mean * (alpha - 1) / alpha
+        return lambda: xm * rng.paretovariate(alpha)
+    raise ValueError(f"Bilinmeyen süre dağılımı: {kind}")
+
+
+def generate_rows(count, seed=0, arrival='poisson', rate=0.15, burst='exponential', mean_burst=5.0,
+                  priority_mix=(0.2, 0.5, 0.3), decimals=3, max_burst=None, arrival_params=None,
+                  burst_params=None):
+    """(id, varış, süre, öncelik) metin demetleri üretir; öncelik karışımı None ise öncelik None'dır.
+
+    Değerler 'decimals' basamağa yuvarlanır; süre en az 10^-decimals olur. Varışlar artan sıradadır.
+    """
+    # Varış, süre ve öncelik ayrı akışlardan çekilir; biri değiştirildiğinde diğerleri aynı kalır
+    rng = random.Random(f"{seed}:arrival")
+    if arrival == 'poisson':
+        times = poisson_arrivals(rng, rate, **(arrival_params or {}))
+    elif arrival == 'mmpp':
+        times = mmpp_arrivals(rng, rate, **(arrival_params or {}))
+    elif arrival == 'diurnal':
+        times = diurnal_arrivals(rng, rate, **(arrival_params or {}))
+    else:
+        raise ValueError(f"Bilinmeyen varış süreci: {arrival}")
+    sample = burst_sampler(random.Random(f"{seed}:burst"), burst, mean_burst, **(burst_params or {}))
+
+    cumulative = None
+    draw = random.Random(f"{seed}:priority").random
+    if priority_mix is not None:
+        total = sum(priority_mix)
+        if total <= 0 or min(priority_mix) < 0:
+            raise ValueError("Öncelik oranları negatif olamaz ve toplamları pozitif olmalıdır.")
+        cumulative = []
+        acc = 0.0
+        for w in priority_mix[:-1]:
+            acc += w / total
+            cumulative.append(acc)
+
+    width = max(3, len(str(count)))
+    smallest = 10 ** -decimals
+    cap = max_burst if max_burst is not None else math.inf
+    if cap < smallest:
+        raise ValueError(f"Süre üst sınırı en az {smallest:g} olmalıdır.")
+    for k in range(count):
+        b = min(max(round(sample(), decimals), smallest), cap)
+        priority = None
+        if cumulative is not None:
+            priority = PRIORITY_LABELS[bisect_right(cumulative, draw())]
+        yield f"P{k + 1:0{width}d}", f"{next(times):.{decimals}f}", f"{b:.{decimals}f}", priority
+
+
+def write_workload(path, rows, has_priority=True, buffer_lines=8192):
+    """Satırları CSV dosyasına tamponlu olarak yazar; yazılan satır sayısını döndürür."""
+    header = HEADER if has_priority else HEADER.rsplit(",", 1)[0]
+    count = 0
+    buffer = [header]
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        for row in rows:
+            buffer.append(",".join(row if has_priority else row[:3]))
+            count += 1
+            if len(buffer) >= buffer_lines:
+                f.write("\n".join(buffer) + "\n")
+                buffer = []
+        if buffer:
+            f.write("\n".join(buffer) + "\n")
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik İş Yükü (CSV) Üreteci")
+    parser.add_argument('-n', '--count', type=int, required=True, help='Üretilecek işlem sayısı')
+    parser.add_argument('--seed', type=int, default=0, help='Rastgele sayı tohumu (Varsayılan: 0)')
+    parser.add_argument('-o', '--output', type=str, default=None,
+                        help='Çıktı CSV dosyası (Varsayılan: is_yuku_[varış]_[süre]_[n]_s[tohum].csv)')
+
+    group = parser.add_argument_group('Varış süreci')
+    group.add_argument('--arrival', choices=ARRIVALS, default='poisson', help='Varış süreci (Varsayılan: poisson)')
+    group.add_argument('--rate', type=float, default=0.15,
+                       help='Birim zamandaki ortalama varış sayısı; mmpp için sakin dönem hızı (Varsayılan: 0.15)')
+    group.add_argument('--peak-factor', type=float, default=10.0,
+                       help='mmpp: yoğun dönem hızı / sakin dönem hızı (Varsayılan: 10)')
+    group.add_argument('--quiet-time', type=float, default=200.0,
+                       help='mmpp: sakin dönemin ortalama uzunluğu (Varsayılan: 200)')
+    group.add_argument('--peak-time', type=float, default=20.0,
+                       help='mmpp: yoğun dönemin ortalama uzunluğu (Varsayılan: 20)')
+    group.add_argument('--period', type=float, default=1440.0,
+                       help='diurnal: yük döngüsünün periyodu (Varsayılan: 1440)')
+    group.add_argument('--amplitude', type=float, default=0.8,
+                       help='diurnal: hızın ortalamaya göre göreli genliği, 0-1 (Varsayılan: 0.8)')
+
+    group = parser.add_argument_group('Süre (burst) dağılımı')
+    group.add_argument('--burst', choices=BURSTS, default='exponential',
+                       help='Süre dağılımı (Varsayılan: exponential)')
+    group.add_argument('--mean-burst', type=float, default=5.0, help='Ortalama süre (Varsayılan: 5)')
+    group.add_argument('--sigma', type=float, default=1.0, help='lognormal: log-standart sapma (Varsayılan: 1)')
+    group.add_argument('--long-fraction', type=float, default=0.1,
+                       help='bimodal: uzun işlerin oranı (Varsayılan: 0.1)')
+    group.add_argument('--long-factor', type=float, default=20.0,
+                       help='bimodal: uzun iş ortalaması / kısa iş ortalaması (Varsayılan: 20)')
+    group.add_argument('--alpha', type=float, default=1.5, help='pareto: kuyruk üssü, > 1 (Varsayılan: 1.5)')
+    group.add_argument('--max-burst', type=float, default=None, help='Süreler bu değerle sınırlanır')
+
+    group = parser.add_argument_group('Öncelik ve biçim')
+    mix = group.add_mutually_exclusive_group()
+    mix.add_argument('--priority-mix', nargs=3, type=float, default=[0.2, 0.5, 0.3], metavar=('HIGH', 'NORMAL', 'LOW'),
+                     help='high/normal/low oranları (Varsayılan: 0.2 0.5 0.3)')
+    mix.add_argument('--no-priority', action='store_true', help='Priority sütunu olmadan üret')
+    group.add_argument('--decimals', type=int, default=3,
+                       help='Varış ve süre değerlerinin ondalık basamak sayısı, 0-6 (Varsayılan: 3)')
+    args = parser.parse_args(argv)
+
+    if args.count < 0:
+        parser.error("İşlem sayısı negatif olamaz")
+    if args.rate <= 0 or args.mean_burst <= 0:
+        parser.error("--rate ve --mean-burst pozitif olmalıdır")
+    if not 0 <= args.decimals <= 6:
+        # Simülatörler zamanı 10^-6 birim çözünürlükte tutar
+        parser.error("--decimals 0 ile 6 arasında olmalıdır")
+    if args.max_burst is not None and args.max_burst < 10 ** -args.decimals:
+        # Üst sınır en küçük yazılabilir süreden (10^-decimals) küçük olursa 0 veya negatif süre çıkar
+        parser.error(f"--max-burst en az {10 ** -args.decimals:g} olmalıdır (--decimals {args.decimals})")
+    if not 0 <= args.amplitude <= 1:
+        parser.error("--amplitude 0 ile 1 arasında olmalıdır")
+    if not 0 <= args.long_fraction <= 1:
+        parser.error("--long-fraction 0 ile 1 arasında olmalıdır")
+    if min(args.peak_factor, args.quiet_time, args.peak_time, args.period, args.long_factor) <= 0:
+        parser.error("Varış ve süre parametreleri pozitif olmalıdır")
+
+    arrival_params = {
+        'poisson': {},
+        'mmpp': {'peak_factor': args.peak_factor, 'quiet_time': args.quiet_time, 'peak_time': args.peak_time},
+        'diurnal': {'period': args.period, 'amplitude': args.amplitude},
+    }[args.arrival]
+    burst_params = {
+        'exponential': {},
+        'lognormal': {'sigma': args.sigma},
+        'bimodal': {'long_fraction': args.long_fraction, 'long_factor': args.long_factor},
+        'pareto': {'alpha': args.alpha},
+    }[args.burst]
+
+    output = args.output or f"is_yuku_{args.arrival}_{args.burst}_{args.count}_s{args.seed}.csv"
+    priority_mix = None if args.no_priority else args.priority_mix
+
+    try:
+        rows = generate_rows(args.count, args.seed, args.arrival, args.rate, args.burst, args.mean_burst,
+                             priority_mix, args.decimals, args.max_burst, arrival_params, burst_params)
+        count = write_workload(output, rows, has_priority=priority_mix is not None)
+        print(f"İşlem Tamamlandı. {count} işlem '{output}' dosyasına yazıldı.")
+    except Exception as e:
+        print(f"Hata oluştu: {e}")
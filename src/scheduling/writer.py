@@ -0,0 +1,123 @@
+# Sonuç dosyası için artımlı (incremental) yazıcı.
+# Zaman tablosu satırları oluştukça tampona alınır ve tampon dolduğunda diske yazılır;
+# a-f özet bölümleri en sonda eklenir. Böylece çıktı için kullanılan bellek zaman
+# tablosunun uzunluğundan bağımsızdır ve koşu yarıda kesilse bile yazılanlar kaybolmaz.
+
+import bz2
+import gzip
+import lzma
+
+from .profiling import phase
+from .report import entry_lines, header_lines, summary_lines
+from .timeline import IDLE, Timeline
+
+# Sıkıştırma türü -> dosya uzantısı
+COMPRESSION_SUFFIXES = {'gzip': '.gz', 'bz2': '.bz2', 'xz': '.xz', 'zstd': '.zst'}
+
+
+def open_output(path, compression=None):
+    """Metin modunda (utf-8) çıktı dosyası açar; istenirse sıkıştırarak."""
+    if compression is None:
+        return open(path, "w", encoding="utf-8")
+    if compression == 'gzip':
+        return gzip.open(path, "wt", encoding="utf-8")
+    if compression == 'bz2':
+        return bz2.open(path, "wt", encoding="utf-8")
+    if compression == 'xz':
+        return lzma.open(path, "wt", encoding="utf-8")
+    if compression == 'zstd':
+        # zstandard isteğe bağlı bir bağımlılıktır; sadece bu seçenekte gerekir
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd sıkıştırma için 'zstandard' paketi gerekli (pip install zstandard)") from None
+        return zstandard.open(path, "wt", encoding="utf-8")
+    raise ValueError(f"Bilinmeyen sıkıştırma türü: {compression}")
+
+
+class ReportWriter:
+    """Başlık, zaman tablosu ve özet bölümlerini sırayla yazan tamponlu yazıcı."""
+
+    def __init__(self, path, compression=None, buffer_lines=8192, profiler=None):
+        self.path = path
+        self.f = open_output(path, compression)
+        self.buffer = []
+        self.buffer_lines = buffer_lines
+        # Profil açıksa diske yazma süresi 'write' aşamasına sayılır (tampon başına bir ölçüm)
+        self.profiler = profiler
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write_header(self, title, base_name):
+        for line in header_lines(title, base_name):
+            self.write_line(line)
+
+    def write_line(self, line):
+        self.buffer.append(line)
+        if len(self.buffer) >= self.buffer_lines:
+            self.flush()
+
+    def write_summary(self, metrics):
+        # Özet, zaman tablosunun son satırından sonra gelir; dosya yeni satırla bitmez
+        with phase(self.profiler, 'write'):
+            self.flush()
+            self.f.write("\n".join(summary_lines(metrics)))
+
+    def flush(self):
+        if self.buffer:
+            with phase(self.profiler, 'write'):
+                self.f.write("\n".join(self.buffer) + "\n")
+                self.buffer = []
+                self.f.flush()
+
+    def close(self):
+        with phase(self.profiler, 'write'):
+            self.flush()
+            self.f.close()
+
+
+class StreamingTimeline(Timeline):
+    """Sadece birleştirilebilecek son dilimi tutar; kesinleşen satırları emit'e verir."""
+
+    def __init__(self, emit, ids, mode='expanded'):
+        super().__init__()
+        self.emit = emit    # Her zaman tablosu satırı için çağrılır
+        self.ids = ids      # İşlem kimlikleri (liste veya akış modunda canlı işlemler sözlüğü)
+        self.mode = mode
+        self.labels = {}    # Bekleyen dilimin kimliği; işlem silinse de yazılabilsin
+        self.switches = 0
+
+    def add_entry(self, start, idx, end):
+        entries = self.entries
+        if entries and entries[-1][1] == idx and entries[-1][2] == start:
+            entries[-1][2] = end
+            return
+        self.flush()
+        entries.append([start, idx, end])
+        if idx != IDLE:
+            self.labels = {idx: self.ids[idx]}
+
+    def add_round_entry(self, entry):
+        # Tur bloğu bir sonraki dilimle birleşemez; hemen yazılabilir
+        self.flush()
+        self.switches += entry[3] * len(entry[4])
+        self.emit_entry(entry, self.ids)
+
+    def flush(self):
+        if self.entries:
+            entry = self.entries.pop()
+            if entry[1] != IDLE:
+                self.switches += 1
+            self.emit_entry(entry, self.labels)
+
+    def emit_entry(self, entry, ids):
+        # Kesinleşen kaydı metin satırlarına çevir; ikili biçim bunu ezer
+        for line in entry_lines(entry, ids, self.mode):
+            self.emit(line)
+
+    def context_switches(self):
+        return self.switches + sum(1 for e in self.entries if e[1] != IDLE)